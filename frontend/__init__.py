@@ -1,6 +1,6 @@
-# frontend/__init__.py
-"""
-Streamlit Frontend for Auto-Resume Agent
-"""
-
-__version__ = "1.0.0"
+# frontend/__init__.py
+"""
+Streamlit Frontend for Auto-Resume Agent
+"""
+
+__version__ = "1.0.0"
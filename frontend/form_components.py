@@ -1,406 +1,580 @@
-# frontend/form_components.py
-"""
-通用表单组件
-基于 module_config.py 的配置渲染表单
-"""
-
-import streamlit as st
-from typing import Dict, Any, List
-from module_config import RESUME_MODULES, ModuleConfig
-
-
-def render_checkbox_section(resume_data: Dict[str, Any]) -> Dict[str, bool]:
-    """渲染模块选择复选框"""
-    st.markdown("### ⚙️ 选择要包含的简历部分")
-    col1, col2, col3 = st.columns(3)
-
-    include_flags = {}
-
-    # 定义复选框的分组
-    checkbox_groups = [
-        ["personalSummary", "education", "workExperience"],
-        ["skills", "internshipExperience"],
-        ["projects", "awards"]
-    ]
-
-    cols = [col1, col2, col3]
-
-    for col_idx, group in enumerate(checkbox_groups):
-        with cols[col_idx]:
-            for module_key in group:
-                config = RESUME_MODULES.get(module_key)
-                if not config:
-                    continue
-
-                # 判断是否有数据
-                data = resume_data.get(module_key)
-                if config.module_type in ["structured_list", "list"]:
-                    has_data = len(data) > 0 if isinstance(data, list) else False
-                elif config.module_type in ["text", "textarea"]:
-                    has_data = bool(data.strip()) if isinstance(data, str) else False
-                else:
-                    has_data = False
-
-                include_flags[module_key] = st.checkbox(
-                    f"{config.icon} {config.title}",
-                    value=has_data,
-                    key=f"include_{module_key}"
-                )
-
-    return include_flags
-
-
-def render_basic_info_form(resume_data: Dict[str, Any]):
-    """渲染基本信息表单"""
-    st.markdown("### 📋 基本信息")
-
-    basic_info = resume_data.get("basicInfo", {})
-
-    col1, col2 = st.columns(2)
-    with col1:
-        basic_info["name"] = st.text_input("姓名", value=basic_info.get("name", ""), key="basic_name")
-        basic_info["gender"] = st.text_input("性别", value=basic_info.get("gender", ""), key="basic_gender")
-        basic_info["phone"] = st.text_input("电话", value=basic_info.get("phone", ""), key="basic_phone")
-        basic_info["hometown"] = st.text_input("籍贯", value=basic_info.get("hometown", ""), key="basic_hometown")
-
-    with col2:
-        basic_info["position"] = st.text_input("求职意向", value=basic_info.get("position", ""), key="basic_position")
-        basic_info["age"] = st.text_input("年龄", value=basic_info.get("age", ""), key="basic_age")
-        basic_info["email"] = st.text_input("邮箱", value=basic_info.get("email", ""), key="basic_email")
-
-    resume_data["basicInfo"] = basic_info
-
-
-def render_textarea_field(resume_data: Dict[str, Any], module_key: str, config: ModuleConfig):
-    """渲染文本域类型字段"""
-    st.markdown(f"### {config.icon} {config.title}")
-
-    current_value = resume_data.get(module_key, "")
-    resume_data[module_key] = st.text_area(
-        f"{config.title}内容",
-        value=current_value,
-        height=150,
-        key=f"form_{module_key}"
-    )
-
-
-def render_list_field(resume_data: Dict[str, Any], module_key: str, config: ModuleConfig):
-    """渲染简单列表类型字段（如荣誉证书）"""
-    st.markdown(f"### {config.icon} {config.title}")
-
-    items = resume_data.get(module_key, [])
-    if not isinstance(items, list):
-        items = []
-        resume_data[module_key] = items
-
-    # 显示现有项目
-    for idx, item in enumerate(items):
-        col1, col2 = st.columns([5, 1])
-        with col1:
-            items[idx] = st.text_input(
-                f"{config.title} {idx + 1}",
-                value=item,
-                key=f"{module_key}_{idx}"
-            )
-        with col2:
-            if st.button("删除", key=f"del_{module_key}_{idx}"):
-                items.pop(idx)
-                st.rerun()
-
-    # 添加新项目
-    if st.button(f"➕ 添加{config.title}", key=f"add_{module_key}"):
-        items.append("")
-        st.rerun()
-
-
-def render_structured_list_field(resume_data: Dict[str, Any], module_key: str, config: ModuleConfig):
-    """渲染结构化列表类型字段（如教育背景、工作经历等）"""
-    st.markdown(f"### {config.icon} {config.title}")
-
-    items = resume_data.get(module_key, [])
-    if not isinstance(items, list):
-        items = []
-        resume_data[module_key] = items
-
-    # 显示现有项目
-    for idx, item in enumerate(items):
-        with st.expander(f"{config.title} {idx + 1}", expanded=True):
-            render_structured_item_fields(item, config.fields, module_key, idx)
-
-            if st.button("🗑️ 删除此项", key=f"del_{module_key}_{idx}"):
-                items.pop(idx)
-                st.rerun()
-
-    # 添加新项目
-    if st.button(f"➕ 添加{config.title}", key=f"add_{module_key}"):
-        # 创建空项目
-        new_item = {}
-        for field in config.fields:
-            if field.get("is_list"):
-                new_item[field["name"]] = []
-            else:
-                new_item[field["name"]] = ""
-        items.append(new_item)
-        st.rerun()
-
-
-def render_structured_item_fields(item: Dict[str, Any], fields: List[Dict[str, Any]], module_key: str, idx: int):
-    """渲染结构化项目的字段"""
-    # 按列分组字段
-    col_fields = {1: [], 2: [], None: []}
-    for field in fields:
-        col_fields[field.get("col")].append(field)
-
-    # 渲染第一列和第二列
-    if col_fields[1] or col_fields[2]:
-        col1, col2 = st.columns(2)
-
-        with col1:
-            for field in col_fields[1]:
-                render_single_field(item, field, module_key, idx)
-
-        with col2:
-            for field in col_fields[2]:
-                render_single_field(item, field, module_key, idx)
-
-    # 渲染全宽字段
-    for field in col_fields[None]:
-        render_single_field(item, field, module_key, idx)
-
-
-def render_single_field(item: Dict[str, Any], field: Dict[str, Any], module_key: str, idx: int):
-    """渲染单个字段"""
-    field_name = field["name"]
-    field_label = field["label"]
-    field_type = field["type"]
-    is_list = field.get("is_list", False)
-
-    key = f"{module_key}_{idx}_{field_name}"
-
-    if field_type == "text":
-        item[field_name] = st.text_input(
-            field_label,
-            value=item.get(field_name, ""),
-            key=key
-        )
-    elif field_type == "textarea":
-        if is_list:
-            # 列表类型的文本域（如工作内容）
-            current_list = item.get(field_name, [])
-            if isinstance(current_list, list):
-                text_value = "\n".join(current_list)
-            else:
-                text_value = current_list
-
-            new_text = st.text_area(
-                field_label,
-                value=text_value,
-                height=150,
-                key=key
-            )
-            # 转换回列表
-            item[field_name] = [line.strip() for line in new_text.split("\n") if line.strip()]
-        else:
-            item[field_name] = st.text_area(
-                field_label,
-                value=item.get(field_name, ""),
-                height=100,
-                key=key
-            )
-
-
-def render_module_form(resume_data: Dict[str, Any], module_key: str, include_flags: Dict[str, bool]):
-    """根据模块类型渲染对应的表单"""
-    # 检查是否包含此模块
-    if not include_flags.get(module_key, False):
-        return
-
-    config = RESUME_MODULES.get(module_key)
-    if not config:
-        return
-
-    if config.module_type == "textarea":
-        render_textarea_field(resume_data, module_key, config)
-    elif config.module_type == "list":
-        render_list_field(resume_data, module_key, config)
-    elif config.module_type == "structured_list":
-        render_structured_list_field(resume_data, module_key, config)
-
-
-def render_all_module_forms(resume_data: Dict[str, Any], include_flags: Dict[str, bool]):
-    """渲染所有模块表单"""
-    # 按照默认顺序渲染
-    module_order = [
-        "personalSummary",
-        "education",
-        "skills",
-        "workExperience",
-        "internshipExperience",
-        "projects",
-        "awards"
-    ]
-
-    for module_key in module_order:
-        render_module_form(resume_data, module_key, include_flags)
-
-
-def render_form_with_count(resume_data: Dict[str, Any], include_flags: Dict[str, bool], count_values: Dict[str, int]) -> Dict[str, Any]:
-    """
-    渲染带数量控制的表单
-    返回收集到的表单数据
-    """
-    result = {}
-
-    # 1. 自我评价
-    if include_flags.get("personalSummary", False):
-        with st.expander("🔍 自我评价", expanded=True):
-            result["personalSummary"] = st.text_area(
-                "请简要描述您的专业背景、核心技能和求职意向",
-                value=resume_data.get("personalSummary", ""),
-                height=100,
-                key="form_personalSummary"
-            )
-    else:
-        result["personalSummary"] = ""
-
-    # 2. 教育背景
-    education = []
-    if include_flags.get("education", False) and count_values.get("education", 0) > 0:
-        with st.expander("🎓 教育背景", expanded=True):
-            for i in range(count_values["education"]):
-                existing_edu = resume_data.get("education", [])[i] if i < len(resume_data.get("education", [])) else {}
-                with st.expander(f"教育经历 {i + 1}", expanded=(i == 0)):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        school = st.text_input(f"学校 {i + 1}", value=existing_edu.get("school", ""), key=f"school_{i}")
-                        major = st.text_input(f"专业 {i + 1}", value=existing_edu.get("major", ""), key=f"major_{i}")
-                        degree = st.text_input(f"学位 {i + 1}", value=existing_edu.get("degree", ""), key=f"degree_{i}")
-                    with col2:
-                        edu_date = st.text_input(f"时间 {i + 1}", value=existing_edu.get("date", ""), key=f"edu_date_{i}")
-                        gpa = st.text_input(f"GPA {i + 1}", value=existing_edu.get("gpa", ""), key=f"gpa_{i}")
-                    courses = st.text_input(f"相关课程 {i + 1}", value=existing_edu.get("courses", ""), key=f"courses_{i}")
-                    education.append({
-                        "school": school,
-                        "major": major,
-                        "degree": degree,
-                        "date": edu_date,
-                        "gpa": gpa,
-                        "courses": courses,
-                    })
-    result["education"] = education
-
-    # 3. 技术能力
-    if include_flags.get("skills", False):
-        with st.expander("💻 技术能力", expanded=True):
-            result["skills"] = st.text_area(
-                "请填写您的技术能力（可以自由组织格式）",
-                value=resume_data.get("skills", ""),
-                height=150,
-                placeholder="例如：\nPython, Java, C++\nDjango, Flask, Spring Boot\nMySQL, Redis, Docker",
-                key="form_skills"
-            )
-    else:
-        result["skills"] = ""
-
-    # 4. 工作经历
-    work_experience = []
-    if include_flags.get("workExperience", False) and count_values.get("workExperience", 0) > 0:
-        with st.expander("💼 工作经历", expanded=True):
-            for i in range(count_values["workExperience"]):
-                existing_work = resume_data.get("workExperience", [])[i] if i < len(resume_data.get("workExperience", [])) else {}
-                with st.expander(f"工作经历 {i + 1}", expanded=(i == 0)):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        company = st.text_input(f"公司/机构 {i + 1}", value=existing_work.get("company", ""), key=f"company_{i}")
-                        job_title = st.text_input(f"职位 {i + 1}", value=existing_work.get("position", ""), key=f"job_title_{i}")
-                    with col2:
-                        work_date = st.text_input(f"工作时间 {i + 1}", value=existing_work.get("date", ""), key=f"work_date_{i}")
-
-                    work_points_text = "\n".join(existing_work.get("points", []))
-                    work_points = st.text_area(
-                        f"工作内容 {i + 1} (每条用换行分隔)",
-                        value=work_points_text,
-                        height=120,
-                        key=f"work_points_{i}",
-                    )
-                    work_experience.append({
-                        "company": company,
-                        "position": job_title,
-                        "date": work_date,
-                        "points": [p.strip() for p in work_points.split("\n") if p.strip()],
-                    })
-    result["workExperience"] = work_experience
-
-    # 5. 实习经历
-    internship_experience = []
-    if include_flags.get("internshipExperience", False) and count_values.get("internshipExperience", 0) > 0:
-        with st.expander("🎓 实习经历", expanded=True):
-            for i in range(count_values["internshipExperience"]):
-                existing_internship = resume_data.get("internshipExperience", [])[i] if i < len(resume_data.get("internshipExperience", [])) else {}
-                with st.expander(f"实习经历 {i + 1}", expanded=(i == 0)):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        intern_company = st.text_input(f"实习公司 {i + 1}", value=existing_internship.get("company", ""), key=f"intern_company_{i}")
-                        intern_position = st.text_input(f"实习职位 {i + 1}", value=existing_internship.get("position", ""), key=f"intern_position_{i}")
-                    with col2:
-                        intern_date = st.text_input(f"实习时间 {i + 1}", value=existing_internship.get("date", ""), key=f"intern_date_{i}")
-
-                    intern_points_text = "\n".join(existing_internship.get("points", []))
-                    intern_points = st.text_area(
-                        f"实习内容 {i + 1} (每条用换行分隔)",
-                        value=intern_points_text,
-                        height=120,
-                        key=f"intern_points_{i}",
-                    )
-                    internship_experience.append({
-                        "company": intern_company,
-                        "position": intern_position,
-                        "date": intern_date,
-                        "points": [p.strip() for p in intern_points.split("\n") if p.strip()],
-                    })
-    result["internshipExperience"] = internship_experience
-
-    # 6. 项目经历
-    projects = []
-    if include_flags.get("projects", False) and count_values.get("projects", 0) > 0:
-        with st.expander("🚀 项目经历", expanded=True):
-            for i in range(count_values["projects"]):
-                existing_proj = resume_data.get("projects", [])[i] if i < len(resume_data.get("projects", [])) else {}
-                with st.expander(f"项目经历 {i + 1}", expanded=(i == 0)):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        project_name = st.text_input(f"项目名称 {i + 1}", value=existing_proj.get("name", ""), key=f"project_name_{i}")
-                    with col2:
-                        project_date = st.text_input(f"项目时间 {i + 1}", value=existing_proj.get("date", ""), key=f"project_date_{i}")
-                    role = st.text_input(f"项目角色 {i + 1}", value=existing_proj.get("role", ""), key=f"role_{i}")
-
-                    project_desc_text = "\n".join(existing_proj.get("description", []))
-                    project_desc = st.text_area(
-                        f"项目描述 {i + 1} (每条用换行分隔)",
-                        value=project_desc_text,
-                        height=120,
-                        key=f"project_desc_{i}",
-                    )
-                    projects.append({
-                        "name": project_name,
-                        "date": project_date,
-                        "role": role,
-                        "description": [d.strip() for d in project_desc.split("\n") if d.strip()],
-                    })
-    result["projects"] = projects
-
-    # 7. 荣誉证书
-    if include_flags.get("awards", False):
-        with st.expander("🏆 荣誉证书", expanded=True):
-            awards_text = "\n".join(resume_data.get("awards", []))
-            awards = st.text_area(
-                "请列出您的主要获奖和发表论文情况 (每条用换行分隔)",
-                value=awards_text,
-                height=100,
-                key="form_awards"
-            )
-            result["awards"] = [a.strip() for a in awards.split("\n") if a.strip()] if awards else []
-    else:
-        result["awards"] = []
-
-    return result
+# frontend/form_components.py
+"""
+通用表单组件
+基于 module_config.py 的配置渲染表单
+"""
+
+import copy
+
+import streamlit as st
+from typing import Dict, Any, List, Optional
+from module_config import MODULE_ORDER_TUPLE, RESUME_MODULES, ModuleConfig
+
+# 循环中"第 i 项不存在"时共用的空字典，避免每次迭代新建对象
+_EMPTY_DICT: Dict[str, Any] = {}
+
+
+def _build_field_layout(fields: List[Dict[str, Any]]):
+    """把字段配置按列拆成 (第一列, 第二列, 全宽) 三组"""
+    col1 = tuple(f for f in fields if f.get("col") == 1)
+    col2 = tuple(f for f in fields if f.get("col") == 2)
+    full = tuple(f for f in fields if f.get("col") is None)
+    return col1, col2, full
+
+
+def _list_has_data(data: Any) -> bool:
+    return isinstance(data, list) and len(data) > 0
+
+
+def _text_has_data(data: Any) -> bool:
+    return isinstance(data, str) and bool(data.strip())
+
+
+def _no_data(data: Any) -> bool:
+    return False
+
+
+# 模块 key -> 判断是否有数据的函数，按模块类型在导入时选好
+_HAS_DATA_CHECKS = {
+    key: (
+        _list_has_data
+        if config.module_type in ("structured_list", "list")
+        else _text_has_data
+        if config.module_type in ("text", "textarea")
+        else _no_data
+    )
+    for key, config in RESUME_MODULES.items()
+}
+
+
+# 复选框分组 -> 配置的映射，导入时算好，渲染循环里不再查 RESUME_MODULES
+_CHECKBOX_GROUPS = (
+    ("personalSummary", "education", "workExperience"),
+    ("skills", "internshipExperience"),
+    ("projects", "awards"),
+)
+_MODULES_BY_GROUP = tuple(
+    tuple((key, RESUME_MODULES[key]) for key in group if key in RESUME_MODULES)
+    for group in _CHECKBOX_GROUPS
+)
+
+# 表单区块会读取的简历字段（不含 photo 等不可拷贝的对象）
+_FORM_DATA_KEYS = (
+    "personalSummary",
+    "education",
+    "skills",
+    "workExperience",
+    "internshipExperience",
+    "projects",
+    "awards",
+)
+
+# 按默认顺序排好的 (key, config) 对，渲染时按序迭代，无需再查字典
+_ORDERED_MODULES = tuple(
+    (key, RESUME_MODULES[key]) for key in MODULE_ORDER_TUPLE if key in RESUME_MODULES
+)
+
+# 字段布局只依赖静态配置，导入时算好，渲染时直接查表
+_FIELD_LAYOUTS = {
+    key: _build_field_layout(config.fields)
+    for key, config in RESUME_MODULES.items()
+    if config.fields
+}
+
+
+def render_checkbox_section(resume_data: Dict[str, Any]) -> Dict[str, bool]:
+    """渲染模块选择复选框
+
+    注意不能做成 fragment：数量控制和表单区块都依赖勾选结果，
+    勾选必须触发整页重跑才能立即解锁对应控件。
+    """
+    st.markdown("### ⚙️ 选择要包含的简历部分")
+    # 一次 st.columns 调用，直接复用返回的列容器
+    cols = st.columns(3)
+
+    include_flags = {}
+
+    for col_idx, group in enumerate(_MODULES_BY_GROUP):
+        with cols[col_idx]:
+            for module_key, config in group:
+                # 判断是否有数据
+                has_data = _HAS_DATA_CHECKS[module_key](resume_data.get(module_key))
+
+                include_flags[module_key] = st.checkbox(
+                    f"{config.icon} {config.title}",
+                    value=has_data,
+                    key=f"include_{module_key}"
+                )
+
+    # 同步到 session_state，供各表单区块读取
+    st.session_state["form_include_flags"] = include_flags
+    return include_flags
+
+
+def render_basic_info_form(resume_data: Dict[str, Any]):
+    """渲染基本信息表单"""
+    st.markdown("### 📋 基本信息")
+
+    basic_info = resume_data.get("basicInfo", {})
+
+    col1, col2 = st.columns(2)
+    with col1:
+        basic_info["name"] = st.text_input("姓名", value=basic_info.get("name", ""), key="basic_name")
+        basic_info["gender"] = st.text_input("性别", value=basic_info.get("gender", ""), key="basic_gender")
+        basic_info["phone"] = st.text_input("电话", value=basic_info.get("phone", ""), key="basic_phone")
+        basic_info["hometown"] = st.text_input("籍贯", value=basic_info.get("hometown", ""), key="basic_hometown")
+
+    with col2:
+        basic_info["position"] = st.text_input("求职意向", value=basic_info.get("position", ""), key="basic_position")
+        basic_info["age"] = st.text_input("年龄", value=basic_info.get("age", ""), key="basic_age")
+        basic_info["email"] = st.text_input("邮箱", value=basic_info.get("email", ""), key="basic_email")
+
+    resume_data["basicInfo"] = basic_info
+
+
+def render_textarea_field(resume_data: Dict[str, Any], module_key: str, config: ModuleConfig):
+    """渲染文本域类型字段"""
+    st.markdown(f"### {config.icon} {config.title}")
+
+    current_value = resume_data.get(module_key, "")
+    resume_data[module_key] = st.text_area(
+        f"{config.title}内容",
+        value=current_value,
+        height=150,
+        key=f"form_{module_key}"
+    )
+
+
+def _pop_item(items: List[Any], idx: int):
+    """按钮回调：删除第 idx 项（回调在 rerun 前执行，无需 st.rerun）
+
+    保持剩余项的相对顺序——简历条目顺序对用户有意义，
+    不能用 swap-with-last 之类的 O(1) 删除。
+    """
+    if idx < len(items):
+        del items[idx]
+
+
+def _append_blank_item(items: List[Any], fields: Optional[List[Dict[str, Any]]] = None):
+    """按钮回调：追加一个空白项；结构化列表按字段配置生成空项"""
+    if fields is None:
+        items.append("")
+        return
+    new_item = {}
+    for field in fields:
+        if field.get("is_list"):
+            new_item[field["name"]] = []
+        else:
+            new_item[field["name"]] = ""
+    items.append(new_item)
+
+
+def render_list_field(resume_data: Dict[str, Any], module_key: str, config: ModuleConfig):
+    """渲染简单列表类型字段（如荣誉证书）"""
+    st.markdown(f"### {config.icon} {config.title}")
+
+    # setdefault：缺失时惰性建列表并挂回 resume_data，后续 append 不会丢
+    items = resume_data.setdefault(module_key, [])
+    if not isinstance(items, list):
+        items = []
+        resume_data[module_key] = items
+
+    # 显示现有项目；增删通过 on_click 回调在 rerun 前生效，省掉一次显式 st.rerun
+    for idx, item in enumerate(items):
+        col1, col2 = st.columns([5, 1])
+        with col1:
+            items[idx] = st.text_input(
+                f"{config.title} {idx + 1}",
+                value=item,
+                key=f"{module_key}_{idx}"
+            )
+        with col2:
+            st.button("删除", key=f"del_{module_key}_{idx}", on_click=_pop_item, args=(items, idx))
+
+    # 添加新项目
+    st.button(f"➕ 添加{config.title}", key=f"add_{module_key}", on_click=_append_blank_item, args=(items,))
+
+
+def render_structured_list_field(resume_data: Dict[str, Any], module_key: str, config: ModuleConfig):
+    """渲染结构化列表类型字段（如教育背景、工作经历等）"""
+    st.markdown(f"### {config.icon} {config.title}")
+
+    items = resume_data.setdefault(module_key, [])
+    if not isinstance(items, list):
+        items = []
+        resume_data[module_key] = items
+
+    # 显示现有项目；增删同样走 on_click 回调
+    for idx, item in enumerate(items):
+        with st.expander(f"{config.title} {idx + 1}", expanded=True):
+            render_structured_item_fields(item, config.fields, module_key, idx)
+
+            st.button("🗑️ 删除此项", key=f"del_{module_key}_{idx}", on_click=_pop_item, args=(items, idx))
+
+    # 添加新项目
+    st.button(f"➕ 添加{config.title}", key=f"add_{module_key}", on_click=_append_blank_item, args=(items, config.fields))
+
+
+def render_structured_item_fields(item: Dict[str, Any], fields: List[Dict[str, Any]], module_key: str, idx: int):
+    """渲染结构化项目的字段"""
+    # 布局来自静态配置，优先用导入时算好的结果
+    layout = _FIELD_LAYOUTS.get(module_key)
+    if layout is None:
+        layout = _build_field_layout(fields)
+    col1_fields, col2_fields, full_fields = layout
+
+    # 渲染第一列和第二列
+    if col1_fields or col2_fields:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            for field in col1_fields:
+                render_single_field(item, field, module_key, idx)
+
+        with col2:
+            for field in col2_fields:
+                render_single_field(item, field, module_key, idx)
+
+    # 渲染全宽字段
+    for field in full_fields:
+        render_single_field(item, field, module_key, idx)
+
+
+def _render_text_input_field(item: Dict[str, Any], field: Dict[str, Any], key: str):
+    """渲染单行文本字段"""
+    field_name = field["name"]
+    item[field_name] = st.text_input(
+        field["label"],
+        value=item.get(field_name, ""),
+        key=key
+    )
+
+
+def _render_textarea_text_field(item: Dict[str, Any], field: Dict[str, Any], key: str):
+    """渲染普通文本域字段"""
+    field_name = field["name"]
+    item[field_name] = st.text_area(
+        field["label"],
+        value=item.get(field_name, ""),
+        height=100,
+        key=key
+    )
+
+
+def _render_textarea_list_field(item: Dict[str, Any], field: Dict[str, Any], key: str):
+    """渲染列表类型的文本域字段（如工作内容）"""
+    field_name = field["name"]
+    # 首次渲染时 join 一次，之后由 widget 状态接管
+    if key not in st.session_state:
+        current_list = item.get(field_name, [])
+        st.session_state[key] = "\n".join(current_list) if isinstance(current_list, list) else current_list
+
+    new_text = st.text_area(
+        field["label"],
+        height=150,
+        key=key
+    )
+    # 文本没变时复用上次 split 的结果
+    cache = st.session_state.get(f"_split_cache_{key}")
+    if cache is not None and cache[0] == new_text:
+        item[field_name] = cache[1]
+    else:
+        parsed = [line.strip() for line in new_text.splitlines() if line.strip()]
+        st.session_state[f"_split_cache_{key}"] = (new_text, parsed)
+        item[field_name] = parsed
+
+
+# (字段类型, 是否列表) -> 渲染函数，替代逐层 if/elif
+_FIELD_RENDERERS = {
+    ("text", False): _render_text_input_field,
+    ("textarea", False): _render_textarea_text_field,
+    ("textarea", True): _render_textarea_list_field,
+}
+
+
+def render_single_field(item: Dict[str, Any], field: Dict[str, Any], module_key: str, idx: int):
+    """渲染单个字段"""
+    key = f"{module_key}_{idx}_{field['name']}"
+    renderer = _FIELD_RENDERERS.get((field["type"], field.get("is_list", False)))
+    if renderer is not None:
+        renderer(item, field, key)
+
+
+# 模块类型 -> 渲染函数
+_MODULE_RENDERERS = {
+    "textarea": render_textarea_field,
+    "list": render_list_field,
+    "structured_list": render_structured_list_field,
+}
+
+
+def render_module_form(
+    resume_data: Dict[str, Any],
+    module_key: str,
+    include_flags: Dict[str, bool],
+    config: Optional[ModuleConfig] = None,
+):
+    """根据模块类型渲染对应的表单"""
+    # 检查是否包含此模块
+    if not include_flags.get(module_key, False):
+        return
+
+    if config is None:
+        config = RESUME_MODULES.get(module_key)
+    if not config:
+        return
+
+    renderer = _MODULE_RENDERERS.get(config.module_type)
+    if renderer is not None:
+        renderer(resume_data, module_key, config)
+
+
+def render_all_module_forms(resume_data: Dict[str, Any], include_flags: Dict[str, bool]):
+    """渲染所有模块表单（按默认顺序迭代预先配对的配置）"""
+    for module_key, config in _ORDERED_MODULES:
+        render_module_form(resume_data, module_key, include_flags, config)
+
+
+def render_personal_summary_section():
+    """渲染自我评价区块"""
+    include_flags = st.session_state["form_include_flags"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    if include_flags.get("personalSummary", False):
+        with st.expander("🔍 自我评价", expanded=True):
+            result["personalSummary"] = st.text_area(
+                "请简要描述您的专业背景、核心技能和求职意向",
+                value=resume_data.get("personalSummary", ""),
+                height=100,
+                key="form_personalSummary"
+            )
+    else:
+        result["personalSummary"] = ""
+
+
+def render_education_section():
+    """渲染教育背景区块"""
+    include_flags = st.session_state["form_include_flags"]
+    count_values = st.session_state["form_count_values"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    education = []
+    if include_flags.get("education", False) and count_values.get("education", 0) > 0:
+        with st.expander("🎓 教育背景", expanded=True):
+            existing_education = resume_data.get("education", []) or []
+            n_existing = len(existing_education)
+            for i in range(count_values["education"]):
+                existing_edu = existing_education[i] if i < n_existing else _EMPTY_DICT
+                with st.expander(f"教育经历 {i + 1}", expanded=(i == 0)):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        school = st.text_input(f"学校 {i + 1}", value=existing_edu.get("school", ""), key=f"school_{i}")
+                        major = st.text_input(f"专业 {i + 1}", value=existing_edu.get("major", ""), key=f"major_{i}")
+                        degree = st.text_input(f"学位 {i + 1}", value=existing_edu.get("degree", ""), key=f"degree_{i}")
+                    with col2:
+                        edu_date = st.text_input(f"时间 {i + 1}", value=existing_edu.get("date", ""), key=f"edu_date_{i}")
+                        gpa = st.text_input(f"GPA {i + 1}", value=existing_edu.get("gpa", ""), key=f"gpa_{i}")
+                    courses = st.text_input(f"相关课程 {i + 1}", value=existing_edu.get("courses", ""), key=f"courses_{i}")
+                    education.append({
+                        "school": school,
+                        "major": major,
+                        "degree": degree,
+                        "date": edu_date,
+                        "gpa": gpa,
+                        "courses": courses,
+                    })
+    result["education"] = education
+
+
+def render_skills_section():
+    """渲染技术能力区块"""
+    include_flags = st.session_state["form_include_flags"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    if include_flags.get("skills", False):
+        with st.expander("💻 技术能力", expanded=True):
+            result["skills"] = st.text_area(
+                "请填写您的技术能力（可以自由组织格式）",
+                value=resume_data.get("skills", ""),
+                height=150,
+                placeholder="例如：\nPython, Java, C++\nDjango, Flask, Spring Boot\nMySQL, Redis, Docker",
+                key="form_skills"
+            )
+    else:
+        result["skills"] = ""
+
+
+def render_work_section():
+    """渲染工作经历区块"""
+    include_flags = st.session_state["form_include_flags"]
+    count_values = st.session_state["form_count_values"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    work_experience = []
+    if include_flags.get("workExperience", False) and count_values.get("workExperience", 0) > 0:
+        with st.expander("💼 工作经历", expanded=True):
+            existing_list = resume_data.get("workExperience", []) or []
+            n_existing = len(existing_list)
+            for i in range(count_values["workExperience"]):
+                existing_work = existing_list[i] if i < n_existing else _EMPTY_DICT
+                with st.expander(f"工作经历 {i + 1}", expanded=(i == 0)):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        company = st.text_input(f"公司/机构 {i + 1}", value=existing_work.get("company", ""), key=f"company_{i}")
+                        job_title = st.text_input(f"职位 {i + 1}", value=existing_work.get("position", ""), key=f"job_title_{i}")
+                    with col2:
+                        work_date = st.text_input(f"工作时间 {i + 1}", value=existing_work.get("date", ""), key=f"work_date_{i}")
+
+                    # 仅首次渲染时做 join，之后由 widget 状态接管
+                    if f"work_points_{i}" not in st.session_state:
+                        st.session_state[f"work_points_{i}"] = "\n".join(existing_work.get("points", []))
+                    work_points = st.text_area(
+                        f"工作内容 {i + 1} (每条用换行分隔)",
+                        height=120,
+                        key=f"work_points_{i}",
+                    )
+                    work_experience.append({
+                        "company": company,
+                        "position": job_title,
+                        "date": work_date,
+                        "points": [p.strip() for p in work_points.splitlines() if p.strip()],
+                    })
+    result["workExperience"] = work_experience
+
+
+def render_internship_section():
+    """渲染实习经历区块"""
+    include_flags = st.session_state["form_include_flags"]
+    count_values = st.session_state["form_count_values"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    internship_experience = []
+    if include_flags.get("internshipExperience", False) and count_values.get("internshipExperience", 0) > 0:
+        with st.expander("🎓 实习经历", expanded=True):
+            existing_list = resume_data.get("internshipExperience", []) or []
+            n_existing = len(existing_list)
+            for i in range(count_values["internshipExperience"]):
+                existing_internship = existing_list[i] if i < n_existing else _EMPTY_DICT
+                with st.expander(f"实习经历 {i + 1}", expanded=(i == 0)):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        intern_company = st.text_input(f"实习公司 {i + 1}", value=existing_internship.get("company", ""), key=f"intern_company_{i}")
+                        intern_position = st.text_input(f"实习职位 {i + 1}", value=existing_internship.get("position", ""), key=f"intern_position_{i}")
+                    with col2:
+                        intern_date = st.text_input(f"实习时间 {i + 1}", value=existing_internship.get("date", ""), key=f"intern_date_{i}")
+
+                    if f"intern_points_{i}" not in st.session_state:
+                        st.session_state[f"intern_points_{i}"] = "\n".join(existing_internship.get("points", []))
+                    intern_points = st.text_area(
+                        f"实习内容 {i + 1} (每条用换行分隔)",
+                        height=120,
+                        key=f"intern_points_{i}",
+                    )
+                    internship_experience.append({
+                        "company": intern_company,
+                        "position": intern_position,
+                        "date": intern_date,
+                        "points": [p.strip() for p in intern_points.splitlines() if p.strip()],
+                    })
+    result["internshipExperience"] = internship_experience
+
+
+def render_projects_section():
+    """渲染项目经历区块"""
+    include_flags = st.session_state["form_include_flags"]
+    count_values = st.session_state["form_count_values"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    projects = []
+    if include_flags.get("projects", False) and count_values.get("projects", 0) > 0:
+        with st.expander("🚀 项目经历", expanded=True):
+            existing_list = resume_data.get("projects", []) or []
+            n_existing = len(existing_list)
+            for i in range(count_values["projects"]):
+                existing_proj = existing_list[i] if i < n_existing else _EMPTY_DICT
+                with st.expander(f"项目经历 {i + 1}", expanded=(i == 0)):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        project_name = st.text_input(f"项目名称 {i + 1}", value=existing_proj.get("name", ""), key=f"project_name_{i}")
+                    with col2:
+                        project_date = st.text_input(f"项目时间 {i + 1}", value=existing_proj.get("date", ""), key=f"project_date_{i}")
+                    role = st.text_input(f"项目角色 {i + 1}", value=existing_proj.get("role", ""), key=f"role_{i}")
+
+                    if f"project_desc_{i}" not in st.session_state:
+                        st.session_state[f"project_desc_{i}"] = "\n".join(existing_proj.get("description", []))
+                    project_desc = st.text_area(
+                        f"项目描述 {i + 1} (每条用换行分隔)",
+                        height=120,
+                        key=f"project_desc_{i}",
+                    )
+                    projects.append({
+                        "name": project_name,
+                        "date": project_date,
+                        "role": role,
+                        "description": [d.strip() for d in project_desc.splitlines() if d.strip()],
+                    })
+    result["projects"] = projects
+
+
+def render_awards_section():
+    """渲染荣誉证书区块"""
+    include_flags = st.session_state["form_include_flags"]
+    resume_data = st.session_state["form_resume_data"]
+    result = st.session_state["form_result"]
+
+    if include_flags.get("awards", False):
+        with st.expander("🏆 荣誉证书", expanded=True):
+            if "form_awards" not in st.session_state:
+                st.session_state["form_awards"] = "\n".join(resume_data.get("awards", []))
+            awards = st.text_area(
+                "请列出您的主要获奖和发表论文情况 (每条用换行分隔)",
+                height=100,
+                key="form_awards"
+            )
+            result["awards"] = [a.strip() for a in awards.splitlines() if a.strip()] if awards else []
+    else:
+        result["awards"] = []
+
+
+def render_form_with_count(resume_data: Dict[str, Any], include_flags: Dict[str, bool], count_values: Dict[str, int]) -> Dict[str, Any]:
+    """
+    渲染带数量控制的表单
+    调用方在 st.form 内使用本函数：widget 事件会攒到提交时一并处理，
+    区块函数不能做成 fragment（form 内永远不会独立重跑）。
+    区块间通过 session_state 传递数据，返回收集到的表单数据
+    """
+    # 区块之间通过 session_state 共享输入和结果；
+    # 输入没变时跳过重写，避免无意义的 session_state 更新
+    signature = (
+        tuple(sorted(include_flags.items())),
+        tuple(sorted(count_values.items())),
+    )
+    if st.session_state.get("_form_signature") != signature:
+        st.session_state["_form_signature"] = signature
+        st.session_state["form_include_flags"] = include_flags
+        st.session_state["form_count_values"] = count_values
+    # 同一份数据只做一次快照；rerun 期间区块读快照，外部 dict 的变化不会
+    # 在编辑中途改写 widget 的初始值
+    if st.session_state.get("_form_snapshot_source") is not resume_data:
+        st.session_state["_form_snapshot_source"] = resume_data
+        st.session_state["form_resume_data"] = {
+            key: copy.deepcopy(resume_data.get(key)) for key in _FORM_DATA_KEYS
+        }
+    if "form_result" not in st.session_state:
+        st.session_state["form_result"] = {}
+
+    render_personal_summary_section()
+    render_education_section()
+    render_skills_section()
+    render_work_section()
+    render_internship_section()
+    render_projects_section()
+    render_awards_section()
+
+    return st.session_state["form_result"]
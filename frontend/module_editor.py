@@ -1,450 +1,501 @@
-# frontend/module_editor.py
-"""
-通用的简历模块编辑器组件
-通过配置驱动的方式渲染不同类型的简历模块
-"""
-
-import time
-from typing import Dict
-
-import streamlit as st
-from api_client import modify_resume_module, re_evaluate_module
-from module_config import ModuleConfig, get_module_config
-
-
-def render_ai_buttons(module_key: str, config: ModuleConfig, editing_data: Dict, module_suggestions: Dict):
-    """渲染AI优化和评估按钮"""
-    col1, col2, col3 = st.columns([3, 1, 1])
-
-    with col1:
-        st.markdown("**当前内容：**")
-
-    with col2:
-        if config.ai_modifiable and st.button("🤖 AI优化/生成", key=f"ai_{module_key}", use_container_width=True):
-            with st.spinner("AI正在处理..."):
-                feedback = module_suggestions.get(module_key, "")
-                current_data = editing_data.get(module_key, "" if config.module_type in ["text", "textarea"] else [])
-
-                success, message, modified, operation_log, operation_type = modify_resume_module(
-                    module_key,
-                    current_data,
-                    feedback,
-                )
-
-                if success:
-                    st.session_state.ai_modified_results[module_key] = modified
-                    st.session_state.ai_operation_logs[module_key] = operation_log
-                    st.success(f"{config.title}已{operation_type}")
-                    time.sleep(0.5)
-                    st.rerun()
-                else:
-                    st.error(message)
-
-    with col3:
-        if config.ai_evaluable and st.button("📊 AI评估", key=f"eval_{module_key}", use_container_width=True):
-            with st.spinner("AI正在评估..."):
-                current_data = editing_data.get(module_key, "" if config.module_type in ["text", "textarea"] else [])
-                eval_success, eval_msg, new_suggestion = re_evaluate_module(
-                    module_key,
-                    current_data,
-                )
-
-                if eval_success:
-                    module_suggestions[module_key] = new_suggestion
-                    st.session_state.module_suggestions = module_suggestions
-                    st.success("评估完成")
-                    time.sleep(0.5)
-                    st.rerun()
-                else:
-                    st.error(eval_msg)
-
-
-def render_ai_suggestion(module_key: str, module_suggestions: Dict):
-    """显示AI评估建议"""
-    if module_suggestions.get(module_key):
-        st.info(f"💡 AI建议：{module_suggestions[module_key]}")
-
-
-def render_ai_operation_log(module_key: str):
-    """显示AI操作日志"""
-    if module_key in st.session_state.ai_operation_logs:
-        st.info(f"ℹ️ {st.session_state.ai_operation_logs[module_key]}")
-
-
-def render_textarea_module(module_key: str, config: ModuleConfig, editing_data: Dict):
-    """渲染文本域类型的模块（如自我评价、技术能力）"""
-    current_value = editing_data.get(module_key, "")
-
-    new_value = st.text_area(
-        f"{config.title}内容",
-        value=current_value,
-        height=150 if module_key == "skills" else 100,
-        key=f"edit_{module_key}",
-    )
-
-    # 显示AI修改结果 - 使用markdown格式显示
-    if module_key in st.session_state.ai_modified_results:
-        st.markdown("**🤖 AI生成/优化结果：**")
-        modified_content = st.session_state.ai_modified_results[module_key]
-
-        # 使用markdown显示，保留换行和格式
-        if isinstance(modified_content, str):
-            # 将内容放在引用框中显示
-            st.markdown(f"> {modified_content.replace(chr(10), chr(10) + '> ')}")
-        else:
-            st.text(str(modified_content))
-
-    if st.button(f"💾 保存{config.title}", key=f"save_{module_key}"):
-        editing_data[module_key] = new_value
-        st.session_state.editing_resume_data[module_key] = new_value
-        st.success(f"{config.title}已保存")
-        time.sleep(0.5)
-        st.rerun()
-
-
-def render_list_module(module_key: str, config: ModuleConfig, editing_data: Dict):
-    """渲染简单列表类型的模块（如荣誉证书）"""
-    current_list = editing_data.get(module_key, [])
-    list_text = "\n".join(current_list) if isinstance(current_list, list) else ""
-
-    new_value = st.text_area(
-        f"{config.title} (每条用换行分隔)",
-        value=list_text,
-        height=100,
-        key=f"edit_{module_key}",
-    )
-
-    # 显示AI修改结果 - 使用markdown格式显示
-    if module_key in st.session_state.ai_modified_results:
-        st.markdown("**🤖 AI生成/优化结果：**")
-        modified_content = st.session_state.ai_modified_results[module_key]
-
-        # 如果是列表，使用markdown列表格式显示
-        if isinstance(modified_content, list):
-            for item in modified_content:
-                st.markdown(f"- {item}")
-        elif isinstance(modified_content, str):
-            # 如果是字符串，按行分割并显示为列表
-            for line in modified_content.split("\n"):
-                if line.strip():
-                    st.markdown(f"- {line.strip()}")
-        else:
-            st.text(str(modified_content))
-
-    if st.button(f"💾 保存{config.title}", key=f"save_{module_key}"):
-        editing_data[module_key] = [a.strip() for a in new_value.split("\n") if a.strip()]
-        st.session_state.editing_resume_data[module_key] = editing_data[module_key]
-        st.success(f"{config.title}已保存")
-        time.sleep(0.5)
-        st.rerun()
-
-
-def render_structured_list_item(module_key: str, config: ModuleConfig, item: Dict, index: int, editing_data: Dict):
-    """渲染结构化列表中的单个项目"""
-    with st.container():
-        # 标题和删除按钮
-        col_title, col_delete = st.columns([5, 1])
-        with col_title:
-            st.markdown(f"**{config.title} {index + 1}**")
-        with col_delete:
-            if st.button("🗑️ 删除", key=f"delete_{module_key}_{index}", use_container_width=True):
-                editing_data[module_key].pop(index)
-                st.session_state.editing_resume_data[module_key] = editing_data[module_key]
-                st.rerun()
-
-        # 根据字段配置渲染输入框
-        updated_item = {}
-        col1_fields = [f for f in config.fields if f.get("col") == 1]
-        col2_fields = [f for f in config.fields if f.get("col") == 2]
-        full_width_fields = [f for f in config.fields if f.get("col") is None]
-
-        # 渲染两列布局的字段
-        if col1_fields or col2_fields:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                for field in col1_fields:
-                    value = st.text_input(
-                        field["label"],
-                        value=item.get(field["name"], ""),
-                        key=f"edit_{module_key}_{field['name']}_{index}",
-                    )
-                    updated_item[field["name"]] = value
-
-            with col2:
-                for field in col2_fields:
-                    value = st.text_input(
-                        field["label"],
-                        value=item.get(field["name"], ""),
-                        key=f"edit_{module_key}_{field['name']}_{index}",
-                    )
-                    updated_item[field["name"]] = value
-
-        # 渲染全宽字段
-        for field in full_width_fields:
-            if field["type"] == "textarea":
-                # 处理列表类型的字段（如points, description）
-                if field.get("is_list"):
-                    current_value = "\n".join(item.get(field["name"], []))
-                    value = st.text_area(
-                        field["label"],
-                        value=current_value,
-                        height=120,
-                        key=f"edit_{module_key}_{field['name']}_{index}",
-                    )
-                    updated_item[field["name"]] = [p.strip() for p in value.split("\n") if p.strip()]
-                else:
-                    value = st.text_area(
-                        field["label"],
-                        value=item.get(field["name"], ""),
-                        height=120,
-                        key=f"edit_{module_key}_{field['name']}_{index}",
-                    )
-                    updated_item[field["name"]] = value
-            else:
-                value = st.text_input(
-                    field["label"],
-                    value=item.get(field["name"], ""),
-                    key=f"edit_{module_key}_{field['name']}_{index}",
-                )
-                updated_item[field["name"]] = value
-
-        # 更新数据
-        editing_data[module_key][index] = updated_item
-        st.markdown("---")
-
-
-def render_structured_list_ai_result(module_key: str, config: ModuleConfig):
-    """渲染结构化列表的AI修改结果"""
-    if module_key not in st.session_state.ai_modified_results:
-        return
-
-    st.markdown("**🤖 AI生成/优化结果：**")
-    modified_data = st.session_state.ai_modified_results[module_key]
-
-    if not isinstance(modified_data, list):
-        st.text(str(modified_data))
-        return
-
-    for idx, item in enumerate(modified_data):
-        # 根据模块类型显示不同的标题
-        if module_key == "education":
-            title = item.get("school", "未命名学校")
-        elif module_key in ["workExperience", "internshipExperience"]:
-            title = item.get("company", "未命名公司")
-        elif module_key == "projects":
-            title = item.get("name", "未命名项目")
-        else:
-            title = f"{config.title} {idx + 1}"
-
-        st.markdown(f"**{config.title} {idx + 1}：{title}**")
-
-        # 显示所有字段
-        for field in config.fields:
-            field_name = field["name"]
-            field_label = field["label"].split("(")[0].strip()  # 移除括号说明
-
-            if field.get("is_list"):
-                # 列表类型字段
-                if item.get(field_name):
-                    st.markdown(f"- **{field_label}**：")
-                    for desc in item.get(field_name, []):
-                        st.markdown(f"  - {desc}")
-            else:
-                # 普通字段
-                value = item.get(field_name, "")
-                if value:
-                    st.markdown(f"- **{field_label}**：{value}")
-
-        st.markdown("---")
-
-
-def render_structured_list_module(module_key: str, config: ModuleConfig, editing_data: Dict):
-    """渲染结构化列表类型的模块（如教育背景、工作经历等）"""
-    current_list = editing_data.get(module_key, [])
-
-    # 渲染每个列表项
-    for i, item in enumerate(current_list):
-        render_structured_list_item(module_key, config, item, i, editing_data)
-
-    # 如果列表为空，显示提示
-    if not current_list:
-        st.info(f"📝 当前没有{config.title}，点击下方按钮添加")
-
-    # 添加新项按钮
-    if st.button(f"➕ 添加{config.title}", key=f"add_{module_key}", use_container_width=True):
-        # 创建空白项
-        new_item = {}
-        for field in config.fields:
-            if field.get("is_list"):
-                new_item[field["name"]] = []
-            else:
-                new_item[field["name"]] = ""
-
-        if module_key not in editing_data:
-            editing_data[module_key] = []
-        editing_data[module_key].append(new_item)
-        st.session_state.editing_resume_data[module_key] = editing_data[module_key]
-        st.rerun()
-
-    # 显示AI修改结果
-    render_structured_list_ai_result(module_key, config)
-
-    # 保存按钮
-    if st.button(f"💾 保存{config.title}", key=f"save_{module_key}"):
-        st.session_state.editing_resume_data[module_key] = editing_data.get(module_key, [])
-        st.success(f"{config.title}已保存")
-        time.sleep(0.5)
-        st.rerun()
-
-
-def render_module_editor(module_key: str, editing_data: Dict, module_suggestions: Dict, expanded: bool = False):
-    """
-    渲染单个简历模块的编辑器
-
-    Args:
-        module_key: 模块的key（如 'personalSummary', 'education'）
-        editing_data: 正在编辑的简历数据
-        module_suggestions: AI评估建议
-        expanded: 是否默认展开
-    """
-    config = get_module_config(module_key)
-    if not config:
-        st.error(f"未找到模块配置: {module_key}")
-        return
-
-    with st.expander(f"{config.icon} {config.title}", expanded=expanded):
-        # 渲染AI按钮
-        render_ai_buttons(module_key, config, editing_data, module_suggestions)
-
-        # 显示AI建议
-        render_ai_suggestion(module_key, module_suggestions)
-
-        # 根据模块类型渲染不同的编辑器
-        if config.module_type == "textarea":
-            render_textarea_module(module_key, config, editing_data)
-        elif config.module_type == "list":
-            render_list_module(module_key, config, editing_data)
-        elif config.module_type == "structured_list":
-            render_structured_list_module(module_key, config, editing_data)
-        else:
-            st.error(f"不支持的模块类型: {config.module_type}")
-
-        # 显示AI操作日志
-        render_ai_operation_log(module_key)
-
-
-def render_basic_info_editor(editing_data: Dict):
-    """渲染基本信息编辑器（特殊处理，不支持AI修改）"""
-    with st.expander("📝 个人基本信息", expanded=False):
-        basic_info = editing_data.get("basicInfo", {})
-
-        # 照片上传部分
-        st.markdown("##### 📷 个人照片（可选）")
-        current_photo = editing_data.get("photo")
-
-        # 显示当前照片状态和操作按钮
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            if current_photo:
-                st.success("✅ 已上传照片")
-                if hasattr(current_photo, 'name'):
-                    st.caption(f"文件名: {current_photo.name}")
-            else:
-                st.info("未上传照片")
-
-        with col2:
-            # 如果有照片，显示删除按钮
-            if current_photo:
-                if st.button("🗑️ 删除照片", key="remove_photo", use_container_width=True):
-                    editing_data["photo"] = None
-                    st.session_state.editing_resume_data["photo"] = None
-                    st.success("照片已删除")
-                    time.sleep(0.5)
-                    st.rerun()
-
-        uploaded_photo = st.file_uploader(
-            "上传或更换照片",
-            type=["jpg", "jpeg", "png"],
-            key="edit_photo_upload",
-            help="支持 JPG、JPEG、PNG 格式"
-        )
-
-        if uploaded_photo:
-            st.image(uploaded_photo, width=150, caption="照片预览")
-
-        st.markdown("---")
-
-        # 基本信息
-        st.markdown("##### 基本信息")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            name = st.text_input("姓名 *", value=basic_info.get("name", ""), key="edit_name")
-        with col2:
-            position = st.text_input(
-                "目标职位 *",
-                value=basic_info.get("position", ""),
-                key="edit_position",
-            )
-
-        st.markdown("##### 其他信息（可选）")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            gender = st.text_input(
-                "性别",
-                value=basic_info.get("gender", ""),
-                key="edit_gender",
-                placeholder="例如：男/女"
-            )
-            phone = st.text_input(
-                "电话",
-                value=basic_info.get("phone", ""),
-                key="edit_phone",
-                placeholder="例如：138-0000-0000"
-            )
-
-        with col2:
-            age = st.text_input(
-                "年龄",
-                value=basic_info.get("age", ""),
-                key="edit_age",
-                placeholder="例如：25"
-            )
-            email = st.text_input(
-                "邮箱",
-                value=basic_info.get("email", ""),
-                key="edit_email",
-                placeholder="例如：example@email.com"
-            )
-
-        with col3:
-            hometown = st.text_input(
-                "籍贯",
-                value=basic_info.get("hometown", ""),
-                key="edit_hometown",
-                placeholder="例如：北京"
-            )
-
-        if st.button("💾 保存基本信息", key="save_basic"):
-            # 保存基本信息（包含所有字段）
-            editing_data["basicInfo"] = {
-                "name": name,
-                "position": position,
-                "gender": gender if gender else "",
-                "age": age if age else "",
-                "hometown": hometown if hometown else "",
-                "phone": phone if phone else "",
-                "email": email if email else "",
-            }
-
-            # 保存照片（如果有上传新照片）
-            if uploaded_photo:
-                editing_data["photo"] = uploaded_photo
-                st.session_state.editing_resume_data["photo"] = uploaded_photo
-
-            st.session_state.editing_resume_data["basicInfo"] = editing_data["basicInfo"]
-            st.success("基本信息已保存")
-            time.sleep(0.5)
-            st.rerun()
+# frontend/module_editor.py
+"""
+通用的简历模块编辑器组件
+通过配置驱动的方式渲染不同类型的简历模块
+"""
+
+import json
+import time
+from functools import lru_cache
+from typing import Dict
+
+import streamlit as st
+from api_client import modify_resume_module, re_evaluate_module
+from module_config import ModuleConfig, get_module_config
+
+
+@lru_cache(maxsize=None)
+def _structured_field_layout(module_key: str):
+    """按列拆分字段配置：配置是静态的，每个模块只算一次而不是每个列表项都算"""
+    config = get_module_config(module_key)
+    col1_fields = tuple(f for f in config.fields if f.get("col") == 1)
+    col2_fields = tuple(f for f in config.fields if f.get("col") == 2)
+    full_width_fields = tuple(f for f in config.fields if f.get("col") is None)
+    return col1_fields, col2_fields, full_width_fields
+
+
+# AI按钮去抖间隔（秒）：间隔内的重复点击直接忽略，避免连发请求
+_AI_BUTTON_COOLDOWN = 2.0
+
+
+def _ai_button_throttled(button_key: str) -> bool:
+    """返回 True 表示本次点击处于冷却期内，应忽略"""
+    now = time.time()
+    last_clicks = st.session_state.setdefault("_ai_button_last_click", {})
+    if now - last_clicks.get(button_key, 0.0) < _AI_BUTTON_COOLDOWN:
+        return True
+    last_clicks[button_key] = now
+    return False
+
+
+def render_ai_buttons(module_key: str, config: ModuleConfig, editing_data: Dict, module_suggestions: Dict):
+    """渲染AI优化和评估按钮"""
+    col1, col2, col3 = st.columns([3, 1, 1])
+
+    with col1:
+        st.markdown("**当前内容：**")
+
+    with col2:
+        if (
+            config.ai_modifiable
+            and st.button("🤖 AI优化/生成", key=f"ai_{module_key}", use_container_width=True)
+            and not _ai_button_throttled(f"ai_{module_key}")
+        ):
+            with st.spinner("AI正在处理..."):
+                feedback = module_suggestions.get(module_key, "")
+                current_data = editing_data.get(module_key, "" if config.module_type in ["text", "textarea"] else [])
+
+                success, message, modified, operation_log, operation_type = modify_resume_module(
+                    module_key,
+                    current_data,
+                    feedback,
+                )
+
+                if success:
+                    st.session_state.ai_modified_results[module_key] = modified
+                    st.session_state.ai_operation_logs[module_key] = operation_log
+                    st.toast(f"{config.title}已{operation_type}")
+                    st.rerun()
+                else:
+                    st.error(message)
+
+    with col3:
+        if (
+            config.ai_evaluable
+            and st.button("📊 AI评估", key=f"eval_{module_key}", use_container_width=True)
+            and not _ai_button_throttled(f"eval_{module_key}")
+        ):
+            with st.spinner("AI正在评估..."):
+                current_data = editing_data.get(module_key, "" if config.module_type in ["text", "textarea"] else [])
+                eval_success, eval_msg, new_suggestion = re_evaluate_module(
+                    module_key,
+                    current_data,
+                )
+
+                if eval_success:
+                    module_suggestions[module_key] = new_suggestion
+                    st.session_state.module_suggestions = module_suggestions
+                    st.toast("评估完成")
+                    st.rerun()
+                else:
+                    st.error(eval_msg)
+
+
+def render_ai_suggestion(module_key: str, module_suggestions: Dict):
+    """显示AI评估建议"""
+    if module_suggestions.get(module_key):
+        st.info(f"💡 AI建议：{module_suggestions[module_key]}")
+
+
+def render_ai_operation_log(module_key: str):
+    """显示AI操作日志"""
+    if module_key in st.session_state.ai_operation_logs:
+        st.info(f"ℹ️ {st.session_state.ai_operation_logs[module_key]}")
+
+
+def render_textarea_module(module_key: str, config: ModuleConfig, editing_data: Dict):
+    """渲染文本域类型的模块（如自我评价、技术能力）"""
+    current_value = editing_data.get(module_key, "")
+
+    new_value = st.text_area(
+        f"{config.title}内容",
+        value=current_value,
+        height=150 if module_key == "skills" else 100,
+        key=f"edit_{module_key}",
+    )
+
+    # 显示AI修改结果 - 使用markdown格式显示
+    if module_key in st.session_state.ai_modified_results:
+        st.markdown("**🤖 AI生成/优化结果：**")
+        modified_content = st.session_state.ai_modified_results[module_key]
+
+        # 使用markdown显示，保留换行和格式
+        if isinstance(modified_content, str):
+            # 将内容放在引用框中显示
+            st.markdown(f"> {modified_content.replace(chr(10), chr(10) + '> ')}")
+        else:
+            st.text(str(modified_content))
+
+    if st.button(f"💾 保存{config.title}", key=f"save_{module_key}"):
+        editing_data[module_key] = new_value
+        st.session_state.editing_resume_data[module_key] = new_value
+        st.toast(f"{config.title}已保存")
+        st.rerun()
+
+
+def render_list_module(module_key: str, config: ModuleConfig, editing_data: Dict):
+    """渲染简单列表类型的模块（如荣誉证书）"""
+    widget_key = f"edit_{module_key}"
+    # 只在首次渲染时 join 一次，之后文本存在 widget 状态里，重跑不再重复拼接
+    if widget_key not in st.session_state:
+        current_list = editing_data.get(module_key, [])
+        st.session_state[widget_key] = "\n".join(current_list) if isinstance(current_list, list) else ""
+
+    new_value = st.text_area(
+        f"{config.title} (每条用换行分隔)",
+        height=100,
+        key=widget_key,
+    )
+
+    # 显示AI修改结果 - 使用markdown格式显示
+    if module_key in st.session_state.ai_modified_results:
+        st.markdown("**🤖 AI生成/优化结果：**")
+        modified_content = st.session_state.ai_modified_results[module_key]
+
+        # 如果是列表，使用markdown列表格式显示
+        if isinstance(modified_content, list):
+            for item in modified_content:
+                st.markdown(f"- {item}")
+        elif isinstance(modified_content, str):
+            # 如果是字符串，按行分割并显示为列表
+            for line in modified_content.split("\n"):
+                if line.strip():
+                    st.markdown(f"- {line.strip()}")
+        else:
+            st.text(str(modified_content))
+
+    if st.button(f"💾 保存{config.title}", key=f"save_{module_key}"):
+        # 保存时才做一次 split
+        editing_data[module_key] = [a.strip() for a in new_value.splitlines() if a.strip()]
+        st.session_state.editing_resume_data[module_key] = editing_data[module_key]
+        st.toast(f"{config.title}已保存")
+        st.rerun()
+
+
+def render_structured_list_item(module_key: str, config: ModuleConfig, item: Dict, index: int, editing_data: Dict):
+    """渲染结构化列表中的单个项目"""
+    with st.container():
+        # 标题和删除按钮
+        col_title, col_delete = st.columns([5, 1])
+        with col_title:
+            st.markdown(f"**{config.title} {index + 1}**")
+        with col_delete:
+            if st.button("🗑️ 删除", key=f"delete_{module_key}_{index}", use_container_width=True):
+                editing_data[module_key].pop(index)
+                st.session_state.editing_resume_data[module_key] = editing_data[module_key]
+                st.rerun()
+
+        # 根据字段配置渲染输入框（列布局已在模块级预计算）
+        updated_item = {}
+        col1_fields, col2_fields, full_width_fields = _structured_field_layout(module_key)
+
+        # 渲染两列布局的字段
+        if col1_fields or col2_fields:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                for field in col1_fields:
+                    value = st.text_input(
+                        field["label"],
+                        value=item.get(field["name"], ""),
+                        key=f"edit_{module_key}_{field['name']}_{index}",
+                    )
+                    updated_item[field["name"]] = value
+
+            with col2:
+                for field in col2_fields:
+                    value = st.text_input(
+                        field["label"],
+                        value=item.get(field["name"], ""),
+                        key=f"edit_{module_key}_{field['name']}_{index}",
+                    )
+                    updated_item[field["name"]] = value
+
+        # 渲染全宽字段
+        for field in full_width_fields:
+            if field["type"] == "textarea":
+                # 处理列表类型的字段（如points, description）
+                if field.get("is_list"):
+                    current_value = "\n".join(item.get(field["name"], []))
+                    value = st.text_area(
+                        field["label"],
+                        value=current_value,
+                        height=120,
+                        key=f"edit_{module_key}_{field['name']}_{index}",
+                    )
+                    updated_item[field["name"]] = [p.strip() for p in value.split("\n") if p.strip()]
+                else:
+                    value = st.text_area(
+                        field["label"],
+                        value=item.get(field["name"], ""),
+                        height=120,
+                        key=f"edit_{module_key}_{field['name']}_{index}",
+                    )
+                    updated_item[field["name"]] = value
+            else:
+                value = st.text_input(
+                    field["label"],
+                    value=item.get(field["name"], ""),
+                    key=f"edit_{module_key}_{field['name']}_{index}",
+                )
+                updated_item[field["name"]] = value
+
+        # 更新数据：只在内容实际变化时写回，省掉每次 rerun 的无谓赋值。
+        # 不能按时间去抖：保存按钮在同一次 rerun 里读 editing_data，
+        # 窗口未到就点保存会把编辑丢掉
+        if updated_item != item:
+            editing_data[module_key][index] = updated_item
+        st.markdown("---")
+
+
+@st.cache_data(show_spinner=False)
+def _format_structured_ai_result(module_key: str, data_json: str) -> str:
+    """把AI修改结果格式化为单个 markdown 字符串
+
+    以 (module_key, 内容JSON) 为缓存键：结果没变时直接复用上次的格式化输出。
+    整块只调一次 st.markdown，比每条记录一次调用少走很多前后端消息。
+    """
+    config = get_module_config(module_key)
+    modified_data = json.loads(data_json)
+    segments = []
+
+    for idx, item in enumerate(modified_data):
+        # 根据模块类型显示不同的标题
+        if module_key == "education":
+            title = item.get("school", "未命名学校")
+        elif module_key in ["workExperience", "internshipExperience"]:
+            title = item.get("company", "未命名公司")
+        elif module_key == "projects":
+            title = item.get("name", "未命名项目")
+        else:
+            title = f"{config.title} {idx + 1}"
+
+        lines = [f"**{config.title} {idx + 1}：{title}**"]
+
+        # 显示所有字段
+        for field in config.fields:
+            field_name = field["name"]
+            field_label = field["label"].split("(")[0].strip()  # 移除括号说明
+
+            if field.get("is_list"):
+                # 列表类型字段
+                if item.get(field_name):
+                    lines.append(f"- **{field_label}**：")
+                    for desc in item.get(field_name, []):
+                        lines.append(f"  - {desc}")
+            else:
+                # 普通字段
+                value = item.get(field_name, "")
+                if value:
+                    lines.append(f"- **{field_label}**：{value}")
+
+        lines.append("---")
+        segments.append("\n".join(lines))
+
+    return "\n\n".join(segments)
+
+
+def render_structured_list_ai_result(module_key: str, config: ModuleConfig):
+    """渲染结构化列表的AI修改结果"""
+    if module_key not in st.session_state.ai_modified_results:
+        return
+
+    st.markdown("**🤖 AI生成/优化结果：**")
+    modified_data = st.session_state.ai_modified_results[module_key]
+
+    if not isinstance(modified_data, list):
+        st.text(str(modified_data))
+        return
+
+    # 序列化后交给缓存函数：内容未变化时跳过整个格式化循环，整块一次性渲染
+    data_json = json.dumps(modified_data, ensure_ascii=False)
+    st.markdown(_format_structured_ai_result(module_key, data_json))
+
+
+def render_structured_list_module(module_key: str, config: ModuleConfig, editing_data: Dict):
+    """渲染结构化列表类型的模块（如教育背景、工作经历等）"""
+    current_list = editing_data.get(module_key, [])
+
+    # 渲染每个列表项
+    for i, item in enumerate(current_list):
+        render_structured_list_item(module_key, config, item, i, editing_data)
+
+    # 如果列表为空，显示提示
+    if not current_list:
+        st.info(f"📝 当前没有{config.title}，点击下方按钮添加")
+
+    # 添加新项按钮
+    if st.button(f"➕ 添加{config.title}", key=f"add_{module_key}", use_container_width=True):
+        # 创建空白项
+        new_item = {}
+        for field in config.fields:
+            if field.get("is_list"):
+                new_item[field["name"]] = []
+            else:
+                new_item[field["name"]] = ""
+
+        if module_key not in editing_data:
+            editing_data[module_key] = []
+        editing_data[module_key].append(new_item)
+        st.session_state.editing_resume_data[module_key] = editing_data[module_key]
+        st.rerun()
+
+    # 显示AI修改结果
+    render_structured_list_ai_result(module_key, config)
+
+    # 保存按钮
+    if st.button(f"💾 保存{config.title}", key=f"save_{module_key}"):
+        st.session_state.editing_resume_data[module_key] = editing_data.get(module_key, [])
+        st.toast(f"{config.title}已保存")
+        st.rerun()
+
+
+@st.fragment
+def render_module_editor(module_key: str, editing_data: Dict, module_suggestions: Dict, expanded: bool = False):
+    """
+    渲染单个简历模块的编辑器（fragment：模块内的编辑/保存只重跑本模块）
+
+    Args:
+        module_key: 模块的key（如 'personalSummary', 'education'）
+        editing_data: 正在编辑的简历数据
+        module_suggestions: AI评估建议
+        expanded: 是否默认展开
+    """
+    config = get_module_config(module_key)
+    if not config:
+        st.error(f"未找到模块配置: {module_key}")
+        return
+
+    with st.expander(f"{config.icon} {config.title}", expanded=expanded):
+        # 渲染AI按钮
+        render_ai_buttons(module_key, config, editing_data, module_suggestions)
+
+        # 显示AI建议
+        render_ai_suggestion(module_key, module_suggestions)
+
+        # 根据模块类型渲染不同的编辑器
+        if config.module_type == "textarea":
+            render_textarea_module(module_key, config, editing_data)
+        elif config.module_type == "list":
+            render_list_module(module_key, config, editing_data)
+        elif config.module_type == "structured_list":
+            render_structured_list_module(module_key, config, editing_data)
+        else:
+            st.error(f"不支持的模块类型: {config.module_type}")
+
+        # 显示AI操作日志
+        render_ai_operation_log(module_key)
+
+
+def render_basic_info_editor(editing_data: Dict):
+    """渲染基本信息编辑器（特殊处理，不支持AI修改）"""
+    with st.expander("📝 个人基本信息", expanded=False):
+        basic_info = editing_data.get("basicInfo", {})
+
+        # 照片上传部分
+        st.markdown("##### 📷 个人照片（可选）")
+        current_photo = editing_data.get("photo")
+
+        # 显示当前照片状态和操作按钮
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            if current_photo:
+                st.success("✅ 已上传照片")
+                if hasattr(current_photo, 'name'):
+                    st.caption(f"文件名: {current_photo.name}")
+            else:
+                st.info("未上传照片")
+
+        with col2:
+            # 如果有照片，显示删除按钮
+            if current_photo:
+                if st.button("🗑️ 删除照片", key="remove_photo", use_container_width=True):
+                    editing_data["photo"] = None
+                    st.session_state.editing_resume_data["photo"] = None
+                    st.toast("照片已删除")
+                    st.rerun()
+
+        uploaded_photo = st.file_uploader(
+            "上传或更换照片",
+            type=["jpg", "jpeg", "png"],
+            key="edit_photo_upload",
+            help="支持 JPG、JPEG、PNG 格式"
+        )
+
+        if uploaded_photo:
+            st.image(uploaded_photo, width=150, caption="照片预览")
+
+        st.markdown("---")
+
+        # 基本信息
+        st.markdown("##### 基本信息")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            name = st.text_input("姓名 *", value=basic_info.get("name", ""), key="edit_name")
+        with col2:
+            position = st.text_input(
+                "目标职位 *",
+                value=basic_info.get("position", ""),
+                key="edit_position",
+            )
+
+        st.markdown("##### 其他信息（可选）")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            gender = st.text_input(
+                "性别",
+                value=basic_info.get("gender", ""),
+                key="edit_gender",
+                placeholder="例如：男/女"
+            )
+            phone = st.text_input(
+                "电话",
+                value=basic_info.get("phone", ""),
+                key="edit_phone",
+                placeholder="例如：138-0000-0000"
+            )
+
+        with col2:
+            age = st.text_input(
+                "年龄",
+                value=basic_info.get("age", ""),
+                key="edit_age",
+                placeholder="例如：25"
+            )
+            email = st.text_input(
+                "邮箱",
+                value=basic_info.get("email", ""),
+                key="edit_email",
+                placeholder="例如：example@email.com"
+            )
+
+        with col3:
+            hometown = st.text_input(
+                "籍贯",
+                value=basic_info.get("hometown", ""),
+                key="edit_hometown",
+                placeholder="例如：北京"
+            )
+
+        if st.button("💾 保存基本信息", key="save_basic"):
+            # 保存基本信息（包含所有字段）
+            editing_data["basicInfo"] = {
+                "name": name,
+                "position": position,
+                "gender": gender if gender else "",
+                "age": age if age else "",
+                "hometown": hometown if hometown else "",
+                "phone": phone if phone else "",
+                "email": email if email else "",
+            }
+
+            # 保存照片（如果有上传新照片）
+            if uploaded_photo:
+                editing_data["photo"] = uploaded_photo
+                st.session_state.editing_resume_data["photo"] = uploaded_photo
+
+            st.session_state.editing_resume_data["basicInfo"] = editing_data["basicInfo"]
+            st.toast("基本信息已保存")
+            st.rerun()
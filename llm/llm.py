@@ -1,26 +1,29 @@
-import os
-
-from dotenv import load_dotenv
-from langchain.messages import HumanMessage
-from langchain_openai import ChatOpenAI
-
-load_dotenv()
-
-
-API_KEY = os.getenv("API_KEY", "")
-BASE_URL = os.getenv("BASE_URL", "")
-
-
-def create_llm():
-    return ChatOpenAI(
-        model_name="qwen3-max",
-        api_key=API_KEY,
-        base_url=BASE_URL,
-        temperature=0.7,
-    )
-
-
-if __name__ == "__main__":
-    llm = create_llm()
-    response = llm.invoke([HumanMessage(content="你是什么模型?")])
-    print(response.content)
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+from langchain.messages import HumanMessage
+from langchain_openai import ChatOpenAI
+
+load_dotenv()
+
+
+API_KEY = os.getenv("API_KEY", "")
+BASE_URL = os.getenv("BASE_URL", "")
+
+
+@lru_cache(maxsize=1)
+def create_llm():
+    """客户端无状态且线程安全，进程内只构造一次复用连接池"""
+    return ChatOpenAI(
+        model_name="qwen3-max",
+        api_key=API_KEY,
+        base_url=BASE_URL,
+        temperature=0.7,
+    )
+
+
+if __name__ == "__main__":
+    llm = create_llm()
+    response = llm.invoke([HumanMessage(content="你是什么模型?")])
+    print(response.content)
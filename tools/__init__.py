@@ -1,8 +1,8 @@
-# tools/__init__.py
-from .extract_text import extract_text_from_file
-from .latex_compiler import compile_latex_to_pdf
-
-__all__ = [
-    "extract_text_from_file",
-    "compile_latex_to_pdf",
-]
+# tools/__init__.py
+from .extract_text import extract_text_from_file
+from .latex_compiler import compile_latex_to_pdf
+
+__all__ = [
+    "extract_text_from_file",
+    "compile_latex_to_pdf",
+]
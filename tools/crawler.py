@@ -1,210 +1,294 @@
-import asyncio
-import csv
-import os
-import time
-
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-from playwright.async_api import async_playwright
-from tqdm import tqdm
-
-
-async def get_job_details(url: str, max_count: int = 50, max_retries: int = 3) -> str:
-    """
-    抓取职位搜索页面中的职位详情（使用Playwright异步实现，支持已登录状态）
-    """
-
-    login_data_dir = "./user_data"
-    os.makedirs("data", exist_ok=True)
-    output_path = f"data/job_details_{int(time.time())}.csv"
-
-    # 初始化CSV文件
-    with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
-        csv_writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "公司名称",
-                "职位名称",
-                "工作地点",
-                "薪资范围",
-                "工作经验",
-                "学历要求",
-                "职位标签",
-                "所需技能",
-                "公司规模",
-                "公司阶段",
-                "所属行业",
-                "岗位描述",
-            ],
-        )
-        csv_writer.writeheader()
-
-    async with async_playwright() as p:
-        # 启动浏览器
-        browser = await p.chromium.launch_persistent_context(
-            user_data_dir=login_data_dir,
-            headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-            ],
-        )
-        browser_page = await browser.new_page()
-
-        captured_responses = []
-
-        # 异步响应拦截器
-        async def handle_response(response):
-            if "job/detail.json" in response.url:
-                try:
-                    await _parse_response(response, captured_responses)
-                except Exception as e:
-                    print(f"解析响应失败: {e}")
-
-        def sync_handle_response(response):
-            asyncio.create_task(handle_response(response))
-
-        browser_page.on("response", sync_handle_response)
-
-        # 禁用自动化特征
-        await browser_page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined })
-        """)
-
-        # 页面加载重试逻辑
-        for attempt in range(max_retries):
-            try:
-                await browser_page.goto("https://www.baidu.com", timeout=60000)
-                await browser_page.goto(url, timeout=60000, wait_until="domcontentloaded")
-                await browser_page.wait_for_selector(".job-info", timeout=30000)
-                await browser_page.wait_for_timeout(1000)
-                break
-            except PlaywrightTimeoutError:
-                if attempt == max_retries - 1:
-                    raise Exception(f"经过{max_retries}次尝试后仍无法加载页面")
-                print(f"页面加载超时，正在进行第{attempt + 2}次重试...")
-                await browser_page.reload(timeout=60000)
-
-        # 滚动加载更多岗位
-        last_height = await browser_page.evaluate("document.body.scrollHeight")
-        for _ in range(3):
-            await browser_page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await browser_page.wait_for_timeout(800)
-            new_height = await browser_page.evaluate("document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-
-        # 获取岗位卡片
-        cards = await browser_page.locator(".job-info").all()
-        print(f"发现 {len(cards)} 个岗位卡片")
-
-        count = 0
-        max_jobs = min(len(cards), max_count)
-        pbar = None
-        jobs_buffer = []  # 🔥 使用缓冲区收集数据
-
-        try:
-            if max_jobs > 0:
-                pbar = tqdm(total=max_jobs, desc="抓取岗位中")
-
-            # 🔥 不使用 aiofiles，先收集所有数据
-            for card in cards:
-                if count >= max_jobs:
-                    break
-
-                try:
-                    captured_responses.clear()
-                    await card.scroll_into_view_if_needed()
-                    await card.click()
-
-                    # 等待响应捕获
-                    wait_time = 0
-                    max_wait = 3
-                    while len(captured_responses) == 0 and wait_time < max_wait:
-                        await browser_page.wait_for_timeout(200)
-                        wait_time += 0.2
-
-                    if len(captured_responses) == 0:
-                        if pbar:
-                            pbar.write("未捕获到职位详情响应，跳过该职位")
-                        else:
-                            print("未捕获到职位详情响应，跳过该职位")
-                        continue
-
-                    # 解析职位数据
-                    json_data = captured_responses[0]
-                    zp_data = json_data.get("zpData", {})
-                    job_info = zp_data.get("jobInfo", {})
-                    brand_com_info = zp_data.get("brandComInfo", {})
-
-                    job_data = {
-                        "公司名称": brand_com_info.get("brandName", ""),
-                        "职位名称": job_info.get("jobName", ""),
-                        "工作地点": job_info.get("address", ""),
-                        "薪资范围": job_info.get("salaryDesc", ""),
-                        "工作经验": job_info.get("jobExperience", "无要求"),
-                        "学历要求": job_info.get("degreeName", ""),
-                        "职位标签": job_info.get("experienceName", ""),
-                        "所需技能": ",".join(job_info.get("showSkills", [])),
-                        "公司规模": brand_com_info.get("scaleName", ""),
-                        "公司阶段": brand_com_info.get("stageName", ""),
-                        "所属行业": brand_com_info.get("industryName", ""),
-                        "岗位描述": job_info.get("postDescription", "").strip(),
-                    }
-
-                    # 🔥 添加到缓冲区
-                    jobs_buffer.append(job_data)
-                    count += 1
-
-                    if pbar:
-                        pbar.update(1)
-                        pbar.write(f"✅ 已抓取: {job_data['职位名称']} - {job_data['公司名称']}")
-
-                    await browser_page.wait_for_timeout(500)
-
-                except Exception as e:
-                    error_msg = f"处理职位时出错: {str(e)}"
-                    if pbar:
-                        pbar.write(error_msg)
-                    else:
-                        print(error_msg)
-
-            # 🔥 关键修复：抓取完成后，一次性同步写入所有数据
-            if jobs_buffer:
-                with open(output_path, "a", encoding="utf-8-sig", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=jobs_buffer[0].keys())
-                    writer.writerows(jobs_buffer)
-                print(f"💾 已写入 {len(jobs_buffer)} 条职位数据")
-            else:
-                print("⚠️ 未抓取到任何职位数据")
-
-        finally:
-            # 关闭进度条
-            if pbar is not None:
-                try:
-                    pbar.close()  # 🔥 也不要 await
-                except Exception:
-                    pass
-            # 确保浏览器关闭
-            await browser.close()
-
-    print(f"✅ 已获取职位数据,保存路径: {output_path}")
-    return output_path
-
-
-# 异步解析响应的辅助函数
-async def _parse_response(response, captured_responses):
-    try:
-        data = await response.json()
-        captured_responses.append(data)
-    except Exception as e:
-        print(f"解析响应失败: {e}")
-
-
-if __name__ == "__main__":
-    test_url = "https://www.zhipin.com/web/geek/jobs?city=100010000&position=101310"
-    try:
-        result = asyncio.run(get_job_details(test_url, max_count=3))
-    except Exception as e:
-        print(f"抓取过程中出错: {e}")
+import asyncio
+import csv
+import os
+import time
+from urllib.parse import parse_qs, urlparse
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+from tqdm import tqdm
+
+LOGIN_DATA_DIR = "./user_data"
+
+# CSV列名与 job_data 字典的键一一对应
+CSV_FIELDNAMES = (
+    "公司名称",
+    "职位名称",
+    "工作地点",
+    "薪资范围",
+    "工作经验",
+    "学历要求",
+    "职位标签",
+    "所需技能",
+    "公司规模",
+    "公司阶段",
+    "所属行业",
+    "岗位描述",
+)
+
+# 进程内共享的 Playwright 实例与持久化上下文：
+# 冷启动浏览器要花数秒，多次抓取时只启动一次
+_playwright = None
+_browser_context = None
+# 初始化互斥：并发的首次调用同时冷启动会在同一个 user_data_dir 上
+# 抢 Chromium 的 profile 锁，必须保证只有第一个调用真正启动浏览器
+_browser_lock = asyncio.Lock()
+
+
+async def _get_browser_context():
+    """获取共享的持久化浏览器上下文（首次调用时启动浏览器）"""
+    global _playwright, _browser_context
+    async with _browser_lock:
+        if _browser_context is None:
+            _playwright = await async_playwright().start()
+            _browser_context = await _playwright.chromium.launch_persistent_context(
+                user_data_dir=LOGIN_DATA_DIR,
+                headless=False,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--no-sandbox",
+                    "--disable-setuid-sandbox",
+                ],
+            )
+    return _browser_context
+
+
+async def close_browser():
+    """关闭共享浏览器（进程退出前调用一次）"""
+    global _playwright, _browser_context
+    if _browser_context is not None:
+        await _browser_context.close()
+        _browser_context = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+async def get_job_details(url: str, max_count: int = 50, max_retries: int = 3, max_concurrency: int = 3) -> str:
+    """
+    抓取职位搜索页面中的职位详情（使用Playwright异步实现，支持已登录状态）
+
+    响应按 detail.json URL 里的 jobId 与卡片关联，
+    所以 max_concurrency > 1 时乱序到达的响应也不会串位。
+    """
+
+    os.makedirs("data", exist_ok=True)
+    output_path = f"data/job_details_{int(time.time())}.csv"
+
+    # 整个抓取过程共用一个文件句柄：写完表头后增量写行，不再重开文件。
+    # 句柄和页面都在各自的 try/finally 里：页面加载重试耗尽抛异常时
+    # 也不会泄漏文件句柄，或把页面留在共享浏览器上下文里
+    csv_file = open(output_path, "w", encoding="utf-8-sig", newline="")
+    try:
+        csv_writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
+        csv_writer.writeheader()
+
+        # 复用共享浏览器上下文，每次抓取只新开一个页面
+        browser = await _get_browser_context()
+        browser_page = await browser.new_page()
+        pbar = None
+        try:
+            # 按 jobId 关联的待完成响应：key 是 jobId（识别不到时为 None，退回"最近一次响应"语义）
+            loop = asyncio.get_running_loop()
+            pending = {}
+
+            def _pending_future(job_id):
+                fut = pending.get(job_id)
+                if fut is None:
+                    fut = loop.create_future()
+                    pending[job_id] = fut
+                return fut
+
+            # 异步响应拦截器
+            async def handle_response(response):
+                # 详情接口只会是 xhr/fetch，先按资源类型快速排除图片/脚本等海量响应
+                if response.request.resource_type not in ("xhr", "fetch"):
+                    return
+                if "job/detail.json" not in response.url:
+                    return
+                try:
+                    data = await response.json()
+                except Exception as e:
+                    print(f"解析响应失败: {e}")
+                    return
+
+                job_id = parse_qs(urlparse(response.url).query).get("jobId", [None])[0]
+                # 优先按 jobId 精确匹配，匹配不上时兜底喂给未识别出 jobId 的等待方
+                for key in (job_id, None):
+                    fut = pending.get(key)
+                    if fut is not None and not fut.done():
+                        fut.set_result(data)
+                        break
+
+            # 持有后台任务引用：事件循环只弱引用 task，不存下来可能被中途回收
+            background_tasks = set()
+
+            def sync_handle_response(response):
+                task = asyncio.create_task(handle_response(response))
+                background_tasks.add(task)
+                task.add_done_callback(background_tasks.discard)
+
+            browser_page.on("response", sync_handle_response)
+
+            # 禁用自动化特征
+            await browser_page.add_init_script("""
+                Object.defineProperty(navigator, 'webdriver', { get: () => undefined })
+            """)
+
+            # 页面加载重试逻辑
+            for attempt in range(max_retries):
+                try:
+                    await browser_page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                    await browser_page.wait_for_selector(".job-info", timeout=30000)
+                    break
+                except PlaywrightTimeoutError:
+                    if attempt == max_retries - 1:
+                        raise Exception(f"经过{max_retries}次尝试后仍无法加载页面")
+                    print(f"页面加载超时，正在进行第{attempt + 2}次重试...")
+                    await browser_page.reload(timeout=60000)
+
+            # 滚动加载更多岗位：等页面高度实际变化，而不是固定睡800ms
+            last_height = await browser_page.evaluate("document.body.scrollHeight")
+            for _ in range(3):
+                await browser_page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                try:
+                    await browser_page.wait_for_function(
+                        "height => document.body.scrollHeight > height",
+                        arg=last_height,
+                        timeout=2000,
+                    )
+                except PlaywrightTimeoutError:
+                    break
+                last_height = await browser_page.evaluate("document.body.scrollHeight")
+
+            # 获取岗位卡片
+            card_locator = browser_page.locator(".job-info")
+            cards = await card_locator.all()
+            # 一次JS调用批量取出所有卡片的 jobId，替代每张卡片一次 evaluate 往返
+            job_ids = await card_locator.evaluate_all(
+                """els => els.map(el => {
+                    const tagged = el.closest('[data-jobid]') || el.querySelector('[data-jobid]');
+                    if (tagged) return tagged.getAttribute('data-jobid');
+                    const link = el.closest('a[href]') || el.querySelector('a[href]');
+                    const m = link && link.href.match(/job_detail\\/([^.]+)\\.html/);
+                    return m ? m[1] : null;
+                })"""
+            )
+            print(f"发现 {len(cards)} 个岗位卡片")
+
+            count = 0  # 实际写入CSV的行数
+            # 已预定的名额：并发下等写完行再比较 count 会让多个任务
+            # 同时通过检查，超出 max_count 多写最多并发数-1 行
+            scheduled = 0
+            max_jobs = min(len(cards), max_count)
+
+            # 并发闸门：响应按 jobId 关联后点击才可以安全并发。
+            # 任一卡片解析不到 jobId（DOM选择器失效）就退回串行：
+            # 并发下多个任务会共用同一个 None 兜底 future，一个响应喂饱多张卡片
+            if any(job_id is None for job_id in job_ids):
+                print("⚠️ 部分卡片未解析到 jobId，退回串行点击")
+                semaphore = asyncio.Semaphore(1)
+            else:
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def process_card(card, job_id):
+                nonlocal count, scheduled
+                async with semaphore:
+                    # 点击前先占名额；检查和占位之间没有 await，单线程事件循环下不会竞态
+                    if scheduled >= max_jobs:
+                        return
+                    scheduled += 1
+
+                    try:
+                        response_future = _pending_future(job_id)
+                        await card.scroll_into_view_if_needed()
+                        await card.click()
+
+                        # 等待该卡片对应的响应：事件驱动，响应一到立即继续
+                        try:
+                            json_data = await asyncio.wait_for(response_future, timeout=3)
+                        except asyncio.TimeoutError:
+                            if pbar:
+                                pbar.write("未捕获到职位详情响应，跳过该职位")
+                            else:
+                                print("未捕获到职位详情响应，跳过该职位")
+                            scheduled -= 1  # 释放名额，后面的卡片可以补位
+                            return
+                        finally:
+                            pending.pop(job_id, None)
+
+                        # 解析职位数据
+                        zp_data = json_data.get("zpData", {})
+                        job_info = zp_data.get("jobInfo", {})
+                        brand_com_info = zp_data.get("brandComInfo", {})
+
+                        job_data = {
+                            "公司名称": brand_com_info.get("brandName", ""),
+                            "职位名称": job_info.get("jobName", ""),
+                            "工作地点": job_info.get("address", ""),
+                            "薪资范围": job_info.get("salaryDesc", ""),
+                            "工作经验": job_info.get("jobExperience", "无要求"),
+                            "学历要求": job_info.get("degreeName", ""),
+                            "职位标签": job_info.get("experienceName", ""),
+                            "所需技能": ",".join(job_info.get("showSkills", [])),
+                            "公司规模": brand_com_info.get("scaleName", ""),
+                            "公司阶段": brand_com_info.get("stageName", ""),
+                            "所属行业": brand_com_info.get("industryName", ""),
+                            "岗位描述": job_info.get("postDescription", "").strip(),
+                        }
+
+                        # 增量写入：复用同一个句柄，行立即落盘
+                        csv_writer.writerow(job_data)
+                        count += 1
+
+                        if pbar:
+                            pbar.update(1)
+                            pbar.write(f"✅ 已抓取: {job_data['职位名称']} - {job_data['公司名称']}")
+
+                    except Exception as e:
+                        scheduled -= 1  # 释放名额，后面的卡片可以补位
+                        error_msg = f"处理职位时出错: {str(e)}"
+                        if pbar:
+                            pbar.write(error_msg)
+                        else:
+                            print(error_msg)
+
+            if max_jobs > 0:
+                pbar = tqdm(total=max_jobs, desc="抓取岗位中")
+
+            await asyncio.gather(*(process_card(card, job_id) for card, job_id in zip(cards, job_ids)))
+
+            if count > 0:
+                print(f"💾 已写入 {count} 条职位数据")
+            else:
+                print("⚠️ 未抓取到任何职位数据")
+
+        finally:
+            # 关闭进度条
+            if pbar is not None:
+                try:
+                    pbar.close()  # 🔥 也不要 await
+                except Exception:
+                    pass
+            # 只关闭页面，浏览器留给后续抓取复用
+            await browser_page.close()
+    finally:
+        csv_file.close()
+
+    print(f"✅ 已获取职位数据,保存路径: {output_path}")
+    return output_path
+
+
+async def _main():
+    test_url = "https://www.zhipin.com/web/geek/jobs?city=100010000&position=101310"
+    try:
+        await get_job_details(test_url, max_count=3)
+    finally:
+        await close_browser()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_main())
+    except Exception as e:
+        print(f"抓取过程中出错: {e}")
@@ -1,3 +1,4 @@
+import asyncio
 import io
 from pathlib import Path
 
@@ -5,6 +6,55 @@ import docx
 import pdfplumber
 from fastapi import HTTPException
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pdfium 不可用时退回 pdfplumber
+    pdfium = None
+
+
+def _extract_pdf_text(content: bytes) -> str:
+    """同步解析PDF文本（在线程池中执行，避免阻塞事件循环）
+
+    优先走 pypdfium2（C实现，比 pdfplumber 快一个量级）；
+    pdfium 提取不到文本或不可用时退回 pdfplumber（含表格提取）。
+    """
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(content)
+            try:
+                parts = [page.get_textpage().get_text_range() for page in pdf]
+            finally:
+                pdf.close()
+            text = "\n".join(part for part in parts if part).strip()
+            if text:
+                return text
+        except Exception:
+            # 个别PDF pdfium 解析失败，继续用 pdfplumber 兜底
+            pass
+
+    pdf_file = io.BytesIO(content)
+    # 逐页收集后一次 join，避免字符串反复拼接
+    parts = []
+    with pdfplumber.open(pdf_file) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                parts.append(page_text)
+
+            # 可选：提取表格内容（页面上没有线框时直接跳过，省掉昂贵的表格检测）
+            if page.lines or page.rects:
+                for table in page.extract_tables():
+                    for row in table:
+                        parts.append(" | ".join(cell or "" for cell in row))
+
+    return "\n".join(parts).strip()
+
+
+def _extract_docx_text(content: bytes) -> str:
+    """同步解析DOCX文本（在线程池中执行，避免阻塞事件循环）"""
+    doc = docx.Document(io.BytesIO(content))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
+
 
 async def extract_text_from_file(content: bytes, filename: str) -> str:
     """从不同格式的文件中提取文本"""
@@ -18,37 +68,20 @@ async def extract_text_from_file(content: bytes, filename: str) -> str:
             except UnicodeDecodeError:
                 return content.decode("gbk")
 
-        # PDF文件
+        # PDF文件：解析是CPU/IO密集的同步操作，放到线程池执行
         elif file_ext == ".pdf":
-            pdf_file = io.BytesIO(content)
-            text = ""
-            with pdfplumber.open(pdf_file) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-
-                    # 可选：提取表格内容
-                    tables = page.extract_tables()
-                    for table in tables:
-                        for row in table:
-                            text += " | ".join([cell or "" for cell in row]) + "\n"
-
-            return text.strip()
+            return await asyncio.to_thread(_extract_pdf_text, content)
 
         # DOCX文件
         elif file_ext == ".docx":
-            doc_file = io.BytesIO(content)
-            doc = docx.Document(doc_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return await asyncio.to_thread(_extract_docx_text, content)
         else:
             raise HTTPException(
                 status_code=400,
                 detail=f"不支持的文件格式: {file_ext}，请使用 .txt, .pdf, .docx 格式",
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"解析文件失败: {str(e)}")
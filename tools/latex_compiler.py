@@ -1,116 +1,202 @@
-import shutil
-import subprocess
-from pathlib import Path
-from typing import Optional, Tuple, Union
-
-
-def check_xelatex_installed() -> bool:
-    """检查系统是否安装 xelatex"""
-    return shutil.which("xelatex") is not None
-
-
-def compile_latex_to_pdf(
-    tex_content: str, output_dir: Union[str, Path], filename: str = "resume"
-) -> Tuple[bool, Optional[Path], str]:
-    """
-    编译 LaTeX 到 PDF
-
-    Args:
-        tex_content: LaTeX 文件内容
-        output_dir: 输出目录（字符串或 Path 对象）
-        filename: 文件名（不含扩展名）
-
-    Returns:
-        (成功标志, PDF路径, 错误信息)
-    """
-    # 🔧 统一转换为 Path 对象
-    output_dir = Path(output_dir) if isinstance(output_dir, str) else output_dir
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    if not check_xelatex_installed():
-        return False, None, "❌ 系统未安装 xelatex，请先安装 TeX Live 或 MacTeX"
-
-    # 1. 保存 .tex 文件
-    tex_path = output_dir / f"{filename}.tex"
-    try:
-        with open(tex_path, "w", encoding="utf-8") as f:
-            f.write(tex_content)
-        print(f"✅ LaTeX 文件已保存: {tex_path}")
-    except Exception as e:
-        return False, None, f"❌ 保存失败: {str(e)}"
-
-    # 2. 编译（在 output_dir 中执行）
-    try:
-        print("🔄 正在编译 LaTeX (第1次)...")
-        result = subprocess.run(
-            ["xelatex", "-interaction=nonstopmode", f"{filename}.tex"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(output_dir),
-        )
-
-        print("🔄 正在编译 LaTeX (第2次)...")
-        result = subprocess.run(
-            ["xelatex", "-interaction=nonstopmode", f"{filename}.tex"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(output_dir),
-        )
-
-        # 3. 检查 PDF
-        pdf_path = output_dir / f"{filename}.pdf"
-        if pdf_path.exists():
-            # 清理辅助文件
-            for ext in [".aux", ".log", ".out"]:
-                aux_file = output_dir / f"{filename}{ext}"
-                if aux_file.exists():
-                    aux_file.unlink()
-
-            print(f"✅ PDF 已生成: {pdf_path}")
-            print(f"   大小: {pdf_path.stat().st_size} bytes")
-            return True, pdf_path, ""
-        else:
-            return False, None, _analyze_latex_error(output_dir, filename, result)
-
-    except subprocess.TimeoutExpired:
-        return False, None, "❌ 编译超时（30秒）"
-    except Exception as e:
-        return False, None, f"❌ 编译过程出错: {str(e)}"
-
-
-def _analyze_latex_error(output_dir: Path, filename: str, result) -> str:
-    """分析 LaTeX 编译错误"""
-    log_path = output_dir / f"{filename}.log"
-    error_msg = "❌ 编译失败\n"
-
-    if result.returncode != 0:
-        error_msg += f"返回码: {result.returncode}\n"
-
-    if log_path.exists():
-        error_msg += f"日志文件: {log_path}\n"
-        try:
-            with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-                log_content = f.read()
-
-                # 提取错误行
-                error_lines = [line for line in log_content.split("\n") if line.startswith("!")]
-                if error_lines:
-                    error_msg += "\n关键错误:\n" + "\n".join(error_lines[:5])
-
-                # 检查常见问题
-                if "resume.cls" in log_content and "not found" in log_content:
-                    error_msg += "\n💡 缺少 resume.cls 文档类文件"
-                if "zh_CN-Adobefonts_external" in log_content:
-                    error_msg += "\n💡 缺少中文字体包"
-                if "linespacing_fix" in log_content:
-                    error_msg += "\n💡 缺少 linespacing_fix.sty 包"
-
-        except Exception as e:
-            error_msg += f"\n无法读取日志: {str(e)}"
-
-    if result.stderr:
-        error_msg += f"\nStderr:\n{result.stderr[:300]}"
-
-    return error_msg
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# 常见编译问题的特征串：一次正则扫描找齐，代替对整份日志的多次包含判断
+_LATEX_DIAG_RE = re.compile(r"resume\.cls|zh_CN-Adobefonts_external|linespacing_fix|not found")
+
+# 编译结果缓存：tex 内容哈希 → PDF，内容没变时完全跳过 xelatex
+_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "latex_cache"
+_CACHE_MAX_ENTRIES = 32
+
+
+def _referenced_assets(output_dir: Path) -> list:
+    """编译时会被 tex 按固定路径引用的本地资源（模板类文件和头像）"""
+    assets = sorted(output_dir.glob("*.cls")) + sorted(output_dir.glob("*.sty"))
+    images_dir = output_dir / "images"
+    if images_dir.is_dir():
+        assets += sorted(images_dir.glob("avatar.*"))
+    return assets
+
+
+def _cache_path(tex_content: str, output_dir: Path) -> Path:
+    """缓存键 = tex 内容 + 引用资源的字节
+
+    tex 里以固定路径引用 images/avatar.jpg，换照片不会改变 tex 内容，
+    模板 cls/sty 的改动同理——资源字节必须进键，否则会命中过期的 PDF。
+    """
+    hasher = hashlib.sha256(tex_content.encode("utf-8"))
+    for asset in _referenced_assets(output_dir):
+        try:
+            hasher.update(asset.read_bytes())
+        except OSError:
+            hasher.update(asset.name.encode("utf-8"))
+    return _CACHE_DIR / f"{hasher.hexdigest()}.pdf"
+
+
+def _store_in_cache(pdf_path: Path, cached: Path) -> None:
+    """把编译产物放进缓存，按修改时间淘汰最旧的条目"""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy(pdf_path, cached)
+        entries = sorted(_CACHE_DIR.glob("*.pdf"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[: max(len(entries) - _CACHE_MAX_ENTRIES, 0)]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        # 缓存写入失败不影响编译结果
+        pass
+
+
+@lru_cache(maxsize=1)
+def _xelatex_path() -> Optional[str]:
+    """解析 xelatex 的绝对路径（PATH 在进程生命周期内不变，只walk一次）"""
+    return shutil.which("xelatex")
+
+
+def check_xelatex_installed() -> bool:
+    """检查系统是否安装 xelatex"""
+    return _xelatex_path() is not None
+
+
+def compile_latex_to_pdf(
+    tex_content: str, output_dir: Union[str, Path], filename: str = "resume"
+) -> Tuple[bool, Optional[Path], str]:
+    """
+    编译 LaTeX 到 PDF
+
+    Args:
+        tex_content: LaTeX 文件内容
+        output_dir: 输出目录（字符串或 Path 对象）
+        filename: 文件名（不含扩展名）
+
+    Returns:
+        (成功标志, PDF路径, 错误信息)
+    """
+    # 🔧 统一转换为 Path 对象
+    output_dir = Path(output_dir) if isinstance(output_dir, str) else output_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if not check_xelatex_installed():
+        return False, None, "❌ 系统未安装 xelatex，请先安装 TeX Live 或 MacTeX"
+
+    # 1. 保存 .tex 文件（API 会把 tex 路径返回给前端，文件本身要留在磁盘上）
+    tex_path = output_dir / f"{filename}.tex"
+    try:
+        with open(tex_path, "w", encoding="utf-8") as f:
+            f.write(tex_content)
+        print(f"✅ LaTeX 文件已保存: {tex_path}")
+    except Exception as e:
+        return False, None, f"❌ 保存失败: {str(e)}"
+
+    # 2. 查编译缓存：tex 和引用资源都没变时直接复用上次的 PDF
+    pdf_path = output_dir / f"{filename}.pdf"
+    cached = _cache_path(tex_content, output_dir)
+    if cached.exists():
+        try:
+            shutil.copy(cached, pdf_path)
+            os.utime(cached)  # 刷新 mtime，当作 LRU 的访问时间
+            print(f"✅ 命中编译缓存: {pdf_path}")
+            return True, pdf_path, ""
+        except OSError:
+            pass  # 缓存读取失败就正常编译
+
+    # 3. 编译（在 output_dir 中执行）
+    # 源码直接从内存经 stdin 喂给 xelatex，省掉从磁盘读回 .tex 的往返
+    # 直接用解析好的绝对路径，exec 时不再查一遍 PATH
+    compile_cmd = [_xelatex_path(), "-interaction=nonstopmode", f"-jobname={filename}"]
+    try:
+        print("🔄 正在编译 LaTeX (第1次)...")
+        result = subprocess.run(
+            compile_cmd,
+            input=tex_content,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd=str(output_dir),
+        )
+
+        # 第二遍只在需要解析交叉引用/目录时才跑，多数简历模板用不到
+        if _needs_second_pass(output_dir, filename):
+            print("🔄 正在编译 LaTeX (第2次)...")
+            result = subprocess.run(
+                compile_cmd,
+                input=tex_content,
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=str(output_dir),
+            )
+
+        # 4. 检查 PDF
+        if pdf_path.exists():
+            # 清理辅助文件（missing_ok 免去删除前的 exists 探测）
+            for ext in (".aux", ".log", ".out"):
+                (output_dir / f"{filename}{ext}").unlink(missing_ok=True)
+
+            _store_in_cache(pdf_path, cached)
+
+            print(f"✅ PDF 已生成: {pdf_path}")
+            print(f"   大小: {pdf_path.stat().st_size} bytes")
+            return True, pdf_path, ""
+        else:
+            return False, None, _analyze_latex_error(output_dir, filename, result)
+
+    except subprocess.TimeoutExpired:
+        return False, None, "❌ 编译超时（30秒）"
+    except Exception as e:
+        return False, None, f"❌ 编译过程出错: {str(e)}"
+
+
+def _needs_second_pass(output_dir: Path, filename: str) -> bool:
+    """根据第一遍日志判断是否需要再编译一次（交叉引用/目录尚未解析）"""
+    log_path = output_dir / f"{filename}.log"
+    try:
+        with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
+            log_content = f.read()
+    except OSError:
+        # 日志读不到时保守起见仍然编译第二遍
+        return True
+
+    return "Rerun" in log_content or "undefined references" in log_content
+
+
+def _analyze_latex_error(output_dir: Path, filename: str, result) -> str:
+    """分析 LaTeX 编译错误"""
+    log_path = output_dir / f"{filename}.log"
+    error_msg = "❌ 编译失败\n"
+
+    if result.returncode != 0:
+        error_msg += f"返回码: {result.returncode}\n"
+
+    if log_path.exists():
+        error_msg += f"日志文件: {log_path}\n"
+        try:
+            with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
+                log_content = f.read()
+
+                # 提取错误行
+                error_lines = [line for line in log_content.splitlines() if line.startswith("!")]
+                if error_lines:
+                    error_msg += "\n关键错误:\n" + "\n".join(error_lines[:5])
+
+                # 检查常见问题：一次扫描收集所有命中的特征串
+                hits = set(_LATEX_DIAG_RE.findall(log_content))
+                if "resume.cls" in hits and "not found" in hits:
+                    error_msg += "\n💡 缺少 resume.cls 文档类文件"
+                if "zh_CN-Adobefonts_external" in hits:
+                    error_msg += "\n💡 缺少中文字体包"
+                if "linespacing_fix" in hits:
+                    error_msg += "\n💡 缺少 linespacing_fix.sty 包"
+
+        except Exception as e:
+            error_msg += f"\n无法读取日志: {str(e)}"
+
+    if result.stderr:
+        error_msg += f"\nStderr:\n{result.stderr[:300]}"
+
+    return error_msg
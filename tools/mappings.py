@@ -1,66 +1,66 @@
-# tools/mappings.py
-job_dict = {
-    "Java": "100101",
-    "C/C++": "100102",
-    "Python": "100109",
-    "Golang": "100116",
-    "Node.js": "100114",
-    "图像算法": "101306",
-    "自然语言处理算法": "100117",
-    "大模型算法": "101310",
-    "数据挖掘": "100104",
-    "规控算法": "101311",
-    "SLAM算法": "101312",
-    "推荐算法": "100118",
-    "搜索算法": "100115",
-}
-
-need_to_crawler_jobs = {
-    "语音算法": "101305",
-    "风控算法": "101309",
-    "高性能计算工程师": "101313",
-    "算法工程师": "100120",
-    "算法研究员": "101307",
-    "机器学习": "101301",
-    "深度学习": "101302",
-}
-
-# job_type_dict = {"不限": 1900, "全职": 1901, "实习": 1902, "兼职": 1903}
-# salary_dict = {
-#     "不限": 401,
-#     "3k以下": 402,
-#     "3k-5k": 403,
-#     "5k-10k": 404,
-#     "10k-20k": 405,
-#     "20k-50k": 406,
-#     "50k以上": 407,
-# }
-# experience_dict = {
-#     "不限": 101,
-#     "应届生": 102,
-#     "1年以内": 103,
-#     "1-3年": 104,
-#     "3-5年": 105,
-#     "5-10年": 106,
-#     "10年以上": 107,
-#     "在校生": 108,
-# }
-# degree_dict = {
-#     "不限": 201,
-#     "初中及以下": 209,
-#     "中专/中技": 208,
-#     "高中": 206,
-#     "大专": 202,
-#     "本科": 203,
-#     "硕士": 204,
-#     "博士": 205,
-# }
-# scale_dict = {
-#     "不限": None,
-#     "0-20人": 301,
-#     "20-99人": 302,
-#     "100-499人": 303,
-#     "500-999人": 304,
-#     "1000-9999人": 305,
-#     "10000人以上": 306,
-# }
+# tools/mappings.py
+job_dict = {
+    "Java": "100101",
+    "C/C++": "100102",
+    "Python": "100109",
+    "Golang": "100116",
+    "Node.js": "100114",
+    "图像算法": "101306",
+    "自然语言处理算法": "100117",
+    "大模型算法": "101310",
+    "数据挖掘": "100104",
+    "规控算法": "101311",
+    "SLAM算法": "101312",
+    "推荐算法": "100118",
+    "搜索算法": "100115",
+}
+
+need_to_crawler_jobs = {
+    "语音算法": "101305",
+    "风控算法": "101309",
+    "高性能计算工程师": "101313",
+    "算法工程师": "100120",
+    "算法研究员": "101307",
+    "机器学习": "101301",
+    "深度学习": "101302",
+}
+
+# job_type_dict = {"不限": 1900, "全职": 1901, "实习": 1902, "兼职": 1903}
+# salary_dict = {
+#     "不限": 401,
+#     "3k以下": 402,
+#     "3k-5k": 403,
+#     "5k-10k": 404,
+#     "10k-20k": 405,
+#     "20k-50k": 406,
+#     "50k以上": 407,
+# }
+# experience_dict = {
+#     "不限": 101,
+#     "应届生": 102,
+#     "1年以内": 103,
+#     "1-3年": 104,
+#     "3-5年": 105,
+#     "5-10年": 106,
+#     "10年以上": 107,
+#     "在校生": 108,
+# }
+# degree_dict = {
+#     "不限": 201,
+#     "初中及以下": 209,
+#     "中专/中技": 208,
+#     "高中": 206,
+#     "大专": 202,
+#     "本科": 203,
+#     "硕士": 204,
+#     "博士": 205,
+# }
+# scale_dict = {
+#     "不限": None,
+#     "0-20人": 301,
+#     "20-99人": 302,
+#     "100-499人": 303,
+#     "500-999人": 304,
+#     "1000-9999人": 305,
+#     "10000人以上": 306,
+# }
@@ -1,22 +1,113 @@
 import argparse
+import asyncio
 import csv
 import json
+import logging
 import os
 import sys
 import time
 from pathlib import Path
 
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # orjson 不可用时退回标准库 json
+    orjson = None
+
+
+if orjson is not None:
+
+    def _dumps_line(row: dict) -> str:
+        return orjson.dumps(row).decode("utf-8")
+
+else:
+
+    def _dumps_line(row: dict) -> str:
+        return json.dumps(row, ensure_ascii=False)
+
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(ROOT_DIR))
 
+# 逐卡片的详细输出走日志文件，终端只留 tqdm 进度条：
+# pbar.write 每条都要拿锁重画进度条，海量小写盘会拖慢事件循环
+logger = logging.getLogger("offline_job_crawl")
+
 
 DEFAULT_OUTPUT_DIR = ROOT_DIR / "backend" / "data" / "offline_jobs"
 DEFAULT_COMBINED_PATH = ROOT_DIR / "backend" / "data" / "offline_jobs.jsonl"
 
+# CSV列名与 job_data 字典的键一一对应
+CSV_FIELDNAMES = (
+    "公司名称",
+    "职位名称",
+    "工作地点",
+    "薪资范围",
+    "工作经验",
+    "学历要求",
+    "职位标签",
+    "所需技能",
+    "公司规模",
+    "公司阶段",
+    "所属行业",
+    "岗位描述",
+)
+
+# 与抓取无关的静态资源类型：logo、webfont、样式、媒体只消耗带宽和渲染CPU
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+
+# 英文字符统计用的翻译表：ASCII字母映射为\x01，其余字节为\x00；
+# UTF-8多字节序列不含ASCII字母字节，中文不会被误计
+_ASCII_LETTER_TABLE = bytes(1 if 65 <= b <= 90 or 97 <= b <= 122 else 0 for b in range(256))
+
+
+def _count_english_chars(text: str) -> int:
+    """统计文本中的ASCII英文字母数（C层翻译+计数，替代逐字符Python循环）"""
+    return text.encode("utf-8").translate(_ASCII_LETTER_TABLE).count(1)
+
+
+# 进程内共享的 Playwright 实例与持久化上下文：
+# 13个类目逐个冷启动浏览器要浪费几十秒，整个抓取只启动一次
+_playwright = None
+_browser_context = None
+# 初始化互斥：并发的类目任务同时冷启动会在同一个 user_data_dir 上
+# 抢 Chromium 的 profile 锁，必须保证只有第一个任务真正启动浏览器
+_browser_lock = asyncio.Lock()
+
+
+async def _get_browser_context():
+    """获取共享的持久化浏览器上下文（首次调用时启动浏览器）"""
+    global _playwright, _browser_context
+    async with _browser_lock:
+        if _browser_context is None:
+            login_data_dir = os.getenv("JOB_CRAWL_USER_DATA_DIR", "./user_data")
+            _playwright = await async_playwright().start()
+            _browser_context = await _playwright.chromium.launch_persistent_context(
+                user_data_dir=login_data_dir,
+                headless=False,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--no-sandbox",
+                    "--disable-setuid-sandbox",
+                ],
+            )
+    return _browser_context
+
+
+async def close_browser():
+    """关闭共享浏览器（所有类目抓完后调用一次）"""
+    global _playwright, _browser_context
+    if _browser_context is not None:
+        await _browser_context.close()
+        _browser_context = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
 job_dict = {
     "Java": "100101",
     "C/C++": "100102",
@@ -60,7 +151,7 @@ def get_job_url(except_job: dict, city="100010000", jobType="1901") -> str:
     return url
 
 
-def get_job_details(
+async def get_job_details(
     url: str,
     max_count: int = 200,
     max_retries: int = 3,
@@ -68,7 +159,7 @@ def get_job_details(
     output_dir: str = "jobs/101310",
 ) -> str:
     """
-    抓取职位搜索页面中的职位详情（使用Playwright同步实现，支持已登录状态）
+    抓取职位搜索页面中的职位详情（使用Playwright异步实现，支持已登录状态）
 
     Args:
         url: 职位搜索页面URL
@@ -78,258 +169,256 @@ def get_job_details(
         output_dir: 输出目录
     """
 
-    login_data_dir = os.getenv("JOB_CRAWL_USER_DATA_DIR", "./user_data")
     os.makedirs(output_dir, exist_ok=True)
     output_path = f"{output_dir}/job_details_{int(time.time())}.csv"
 
-    # 初始化CSV文件
-    with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
-        csv_writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "公司名称",
-                "职位名称",
-                "工作地点",
-                "薪资范围",
-                "工作经验",
-                "学历要求",
-                "职位标签",
-                "所需技能",
-                "公司规模",
-                "公司阶段",
-                "所属行业",
-                "岗位描述",
-            ],
-        )
-        csv_writer.writeheader()
-
-    with sync_playwright() as p:
-        # 启动浏览器
-        browser = p.chromium.launch_persistent_context(
-            user_data_dir=login_data_dir,
-            headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-            ],
-        )
-        browser_page = browser.new_page()
-
+    # 复用共享浏览器上下文，每个类目只新开一个页面；
+    # 响应监听器挂在页面上，各类目的捕获状态互不影响。
+    # 页面从创建起就在 try/finally 里：加载重试耗尽抛异常时也会被关闭，
+    # 否则 crawl_one 吞掉异常后每个失败类目都会在共享上下文里漏一个页面
+    browser = await _get_browser_context()
+    browser_page = await browser.new_page()
+    pbar = None
+    try:
         captured_responses = []
+        response_event = asyncio.Event()
 
-        # 响应拦截器
-        def handle_response(response):
+        # 异步响应拦截器
+        async def handle_response(response):
+            # 详情接口只会是 xhr/fetch，先按资源类型快速排除图片/脚本等海量响应
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
             if "job/detail.json" in response.url:
                 try:
-                    _parse_response(response, captured_responses)
+                    await _parse_response(response, captured_responses)
+                    if captured_responses:
+                        response_event.set()
                 except Exception as e:
                     print(f"解析响应失败: {e}")
 
-        browser_page.on("response", handle_response)
+        # 持有后台任务引用：事件循环只弱引用 task，不存下来可能被中途回收
+        background_tasks = set()
+
+        def sync_handle_response(response):
+            task = asyncio.create_task(handle_response(response))
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+
+        browser_page.on("response", sync_handle_response)
+
+        # 屏蔽静态资源：卡片列表和 detail.json 都不依赖图片/字体/样式
+        async def _route(route):
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await browser_page.route("**/*", _route)
 
         # 禁用自动化特征
-        browser_page.add_init_script("""
+        await browser_page.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', { get: () => undefined })
         """)
 
         # 页面加载重试逻辑
         for attempt in range(max_retries):
             try:
-                browser_page.goto("https://www.baidu.com", timeout=60000)
-                browser_page.goto(url, timeout=60000, wait_until="domcontentloaded")
-                browser_page.wait_for_selector(".job-info", timeout=30000)
-                browser_page.wait_for_timeout(1000)
+                await browser_page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                await browser_page.wait_for_selector(".job-info", timeout=30000)
+                await asyncio.sleep(1)
                 break
             except PlaywrightTimeoutError:
                 if attempt == max_retries - 1:
                     raise Exception(f"经过{max_retries}次尝试后仍无法加载页面")
                 print(f"页面加载超时，正在进行第{attempt + 2}次重试...")
-                browser_page.reload(timeout=60000)
+                await browser_page.reload(timeout=60000)
 
         count = 0
         valid_count = 0  # 有效岗位计数（满足字数要求）
         filtered_count = 0  # 被过滤的岗位计数
         filtered_english_count = 0  # 英文JD过滤计数
         page_num = 1
-        pbar = None
         jobs_buffer = []
 
-        try:
-            pbar = tqdm(total=max_count, desc="抓取岗位中")
-
-            # 循环翻页直到抓取到足够的岗位
-            while valid_count < max_count:
-                # 先滚动15次加载足够的岗位（按照原来crawler.py的逻辑）
-                pbar.write(f"📄 第{page_num}页：正在滚动加载岗位...")
-                last_height = browser_page.evaluate("document.body.scrollHeight")
-                for scroll_count in range(5):  # 滚动5次
-                    browser_page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    browser_page.wait_for_timeout(800)
-                    new_height = browser_page.evaluate("document.body.scrollHeight")
-                    if new_height == last_height:
-                        pbar.write(f"   已滚动{scroll_count + 1}次，页面高度不再变化")
-                        break
-                    last_height = new_height
-                else:
-                    pbar.write("   已完成5次滚动")
+        pbar = tqdm(total=max_count, desc="抓取岗位中")
+
+        # 循环翻页直到抓取到足够的岗位
+        while valid_count < max_count:
+            # 先滚动15次加载足够的岗位（按照原来crawler.py的逻辑）
+            logger.info(f"📄 第{page_num}页：正在滚动加载岗位...")
+            last_height = await browser_page.evaluate("document.body.scrollHeight")
+            for scroll_count in range(5):  # 滚动5次
+                await browser_page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await asyncio.sleep(0.8)
+                new_height = await browser_page.evaluate("document.body.scrollHeight")
+                if new_height == last_height:
+                    logger.info(f"   已滚动{scroll_count + 1}次，页面高度不再变化")
+                    break
+                last_height = new_height
+            else:
+                logger.info("   已完成5次滚动")
 
-                # 获取岗位卡片
-                cards = browser_page.locator(".job-info").all()
+            # 获取岗位卡片
+            cards = await browser_page.locator(".job-info").all()
 
-                if len(cards) == 0:
-                    pbar.write(f"⚠️ 第{page_num}页没有找到岗位卡片，可能已到最后一页")
-                    break
+            if len(cards) == 0:
+                logger.info(f"⚠️ 第{page_num}页没有找到岗位卡片，可能已到最后一页")
+                break
 
-                pbar.write(f"📄 第{page_num}页发现 {len(cards)} 个岗位卡片")
+            logger.info(f"📄 第{page_num}页发现 {len(cards)} 个岗位卡片")
 
-                # 处理当前页的岗位
-                for card in cards:
-                    if valid_count >= max_count:
-                        break
+            # 处理当前页的岗位
+            for card in cards:
+                if valid_count >= max_count:
+                    break
 
+                try:
+                    captured_responses.clear()
+                    response_event.clear()
+                    await card.scroll_into_view_if_needed()
+                    await card.click()
+
+                    # 等待响应捕获：事件驱动，响应一到立即继续
                     try:
-                        captured_responses.clear()
-                        card.scroll_into_view_if_needed()
-                        card.click()
-
-                        # 等待响应捕获
-                        wait_time = 0
-                        max_wait = 3
-                        while len(captured_responses) == 0 and wait_time < max_wait:
-                            browser_page.wait_for_timeout(200)
-                            wait_time += 0.2
-
-                        if len(captured_responses) == 0:
-                            pbar.write("⚠️ 未捕获到职位详情响应，跳过该职位")
-                            continue
-
-                        # 解析职位数据
-                        json_data = captured_responses[0]
-                        zp_data = json_data.get("zpData", {})
-                        job_info = zp_data.get("jobInfo", {})
-                        brand_com_info = zp_data.get("brandComInfo", {})
-
-                        job_description = job_info.get("postDescription", "").strip()
-
-                        # 过滤1：岗位描述字数小于指定长度的跳过
-                        if len(job_description) < min_description_length:
-                            filtered_count += 1
-                            pbar.write(
-                                f"⏭️  过滤(字数): {job_info.get('jobName', '')} - {brand_com_info.get('brandName', '')} "
-                                f"(描述仅{len(job_description)}字，小于{min_description_length}字)"
-                            )
-                            browser_page.wait_for_timeout(300)
-                            continue
-
-                        # 过滤2：英文JD（判断英文字符占比）
-                        english_chars = sum(1 for c in job_description if c.isascii() and c.isalpha())
-                        total_chars = len(job_description)
-                        english_ratio = english_chars / total_chars if total_chars > 0 else 0
-
-                        # 如果英文字符占比超过30%，认为是英文JD
-                        if english_ratio > 0.3:
-                            filtered_english_count += 1
-                            pbar.write(
-                                f"⏭️  过滤(英文): {job_info.get('jobName', '')} - {brand_com_info.get('brandName', '')} "
-                                f"(英文占比{english_ratio:.1%})"
-                            )
-                            browser_page.wait_for_timeout(300)
-                            continue
-
-                        job_data = {
-                            "公司名称": brand_com_info.get("brandName", ""),
-                            "职位名称": job_info.get("jobName", ""),
-                            "工作地点": job_info.get("address", ""),
-                            "薪资范围": job_info.get("salaryDesc", ""),
-                            "工作经验": job_info.get("jobExperience", "无要求"),
-                            "学历要求": job_info.get("degreeName", ""),
-                            "职位标签": job_info.get("experienceName", ""),
-                            "所需技能": ",".join(job_info.get("showSkills", [])),
-                            "公司规模": brand_com_info.get("scaleName", ""),
-                            "公司阶段": brand_com_info.get("stageName", ""),
-                            "所属行业": brand_com_info.get("industryName", ""),
-                            "岗位描述": job_description,
-                        }
-
-                        # 添加到缓冲区
-                        jobs_buffer.append(job_data)
-                        valid_count += 1
-                        count += 1
-
-                        pbar.update(1)
-                        pbar.write(
-                            f"✅ [{valid_count}/{max_count}] {job_data['职位名称']} - {job_data['公司名称']} "
-                            f"(描述{len(job_description)}字)"
+                        await asyncio.wait_for(response_event.wait(), timeout=3)
+                    except asyncio.TimeoutError:
+                        pass
+
+                    if len(captured_responses) == 0:
+                        logger.info("⚠️ 未捕获到职位详情响应，跳过该职位")
+                        continue
+
+                    # 响应拦截时已裁剪成CSV字段，这里直接取用
+                    job_data = captured_responses[0]
+                    job_description = job_data["岗位描述"]
+
+                    # 过滤1：岗位描述字数小于指定长度的跳过
+                    if len(job_description) < min_description_length:
+                        filtered_count += 1
+                        logger.info(
+                            f"⏭️  过滤(字数): {job_data['职位名称']} - {job_data['公司名称']} "
+                            f"(描述仅{len(job_description)}字，小于{min_description_length}字)"
+                        )
+                        await asyncio.sleep(0.3)
+                        continue
+
+                    # 过滤2：英文JD（判断英文字符占比）
+                    english_chars = _count_english_chars(job_description)
+                    total_chars = len(job_description)
+                    english_ratio = english_chars / total_chars if total_chars > 0 else 0
+
+                    # 如果英文字符占比超过30%，认为是英文JD
+                    if english_ratio > 0.3:
+                        filtered_english_count += 1
+                        logger.info(
+                            f"⏭️  过滤(英文): {job_data['职位名称']} - {job_data['公司名称']} "
+                            f"(英文占比{english_ratio:.1%})"
                         )
+                        await asyncio.sleep(0.3)
+                        continue
 
-                        browser_page.wait_for_timeout(500)
+                    # 添加到缓冲区
+                    jobs_buffer.append(job_data)
+                    valid_count += 1
+                    count += 1
 
-                    except Exception as e:
-                        pbar.write(f"❌ 处理职位时出错: {str(e)}")
+                    pbar.update(1)
+                    logger.info(
+                        f"✅ [{valid_count}/{max_count}] {job_data['职位名称']} - {job_data['公司名称']} "
+                        f"(描述{len(job_description)}字)"
+                    )
 
-                # 如果已经抓取到足够的岗位，退出循环
-                if valid_count >= max_count:
-                    break
+                    await asyncio.sleep(0.5)
 
-                # 尝试翻页
-                try:
-                    # 查找下一页按钮
-                    next_button = browser_page.locator(".options-pages a.next")
-
-                    # 检查下一页按钮是否存在且可点击
-                    if next_button.count() > 0:
-                        # 检查是否被禁用
-                        is_disabled = next_button.get_attribute("class")
-                        if is_disabled and "disabled" in is_disabled:
-                            pbar.write("📄 已到最后一页，无法继续翻页")
-                            break
-
-                        pbar.write(f"📄 正在翻到第{page_num + 1}页...")
-                        next_button.click()
-                        browser_page.wait_for_timeout(2000)
-                        page_num += 1
-                    else:
-                        pbar.write("📄 未找到下一页按钮，可能已到最后一页")
+                except Exception as e:
+                    logger.info(f"❌ 处理职位时出错: {str(e)}")
+
+            # 如果已经抓取到足够的岗位，退出循环
+            if valid_count >= max_count:
+                break
+
+            # 尝试翻页
+            try:
+                # 查找下一页按钮
+                next_button = browser_page.locator(".options-pages a.next")
+
+                # 检查下一页按钮是否存在且可点击
+                if await next_button.count() > 0:
+                    # 检查是否被禁用
+                    is_disabled = await next_button.get_attribute("class")
+                    if is_disabled and "disabled" in is_disabled:
+                        logger.info("📄 已到最后一页，无法继续翻页")
                         break
 
-                except Exception as e:
-                    pbar.write(f"⚠️ 翻页失败: {str(e)}")
+                    logger.info(f"📄 正在翻到第{page_num + 1}页...")
+                    await next_button.click()
+                    await asyncio.sleep(2)
+                    page_num += 1
+                else:
+                    logger.info("📄 未找到下一页按钮，可能已到最后一页")
                     break
 
-            # 写入所有数据
-            if jobs_buffer:
-                with open(output_path, "a", encoding="utf-8-sig", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=jobs_buffer[0].keys())
-                    writer.writerows(jobs_buffer)
-                print(f"\n💾 已写入 {len(jobs_buffer)} 条职位数据")
-                print(f"📊 统计: 有效岗位 {valid_count} 个，过滤岗位 {filtered_count + filtered_english_count} 个")
-                print(f"   - 字数不足过滤: {filtered_count} 个")
-                print(f"   - 英文JD过滤: {filtered_english_count} 个")
-            else:
-                print("\n⚠️ 未抓取到任何职位数据")
+            except Exception as e:
+                logger.info(f"⚠️ 翻页失败: {str(e)}")
+                break
 
-        finally:
-            # 关闭进度条
-            if pbar is not None:
-                try:
-                    pbar.close()
-                except Exception:
-                    pass
-            # 确保浏览器关闭
-            browser.close()
+        # 写入所有数据：只打开一次文件，表头和数据一起写
+        with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(jobs_buffer)
+
+        if jobs_buffer:
+            print(f"\n💾 已写入 {len(jobs_buffer)} 条职位数据")
+            print(f"📊 统计: 有效岗位 {valid_count} 个，过滤岗位 {filtered_count + filtered_english_count} 个")
+            print(f"   - 字数不足过滤: {filtered_count} 个")
+            print(f"   - 英文JD过滤: {filtered_english_count} 个")
+        else:
+            print("\n⚠️ 未抓取到任何职位数据")
+
+    finally:
+        # 关闭进度条
+        if pbar is not None:
+            try:
+                pbar.close()
+            except Exception:
+                pass
+        # 只关闭本类目的页面，浏览器留给后续类目复用
+        await browser_page.close()
 
     print(f"✅ 已获取职位数据，保存路径: {output_path}")
     return output_path
 
 
-# 解析响应的辅助函数
-def _parse_response(response, captured_responses):
+# 异步解析响应的辅助函数：
+# 在拦截时就裁剪成CSV需要的12个字段，不保留整棵 zpData 响应树
+async def _parse_response(response, captured_responses):
     try:
-        data = response.json()
-        captured_responses.append(data)
+        data = await response.json()
     except Exception as e:
         print(f"解析响应失败: {e}")
+        return
+
+    zp_data = data.get("zpData", {})
+    job_info = zp_data.get("jobInfo", {})
+    brand_com_info = zp_data.get("brandComInfo", {})
+
+    captured_responses.append(
+        {
+            "公司名称": brand_com_info.get("brandName", ""),
+            "职位名称": job_info.get("jobName", ""),
+            "工作地点": job_info.get("address", ""),
+            "薪资范围": job_info.get("salaryDesc", ""),
+            "工作经验": job_info.get("jobExperience", "无要求"),
+            "学历要求": job_info.get("degreeName", ""),
+            "职位标签": job_info.get("experienceName", ""),
+            "所需技能": ",".join(job_info.get("showSkills", [])),
+            "公司规模": brand_com_info.get("scaleName", ""),
+            "公司阶段": brand_com_info.get("stageName", ""),
+            "所属行业": brand_com_info.get("industryName", ""),
+            "岗位描述": job_info.get("postDescription", "").strip(),
+        }
+    )
 
 
 def parse_job_names(raw_jobs: str) -> list[str]:
@@ -346,13 +435,20 @@ def parse_job_names(raw_jobs: str) -> list[str]:
 
 def append_csv_to_jsonl(csv_path: Path, combined_file, job_name: str, job_code: str) -> int:
     count = 0
+    lines = []
     with open(csv_path, "r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
+        # csv.reader + 一次性确定键序，免去 DictReader 每行建字典的字段名哈希
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        keys = (*header, "job_category", "job_code")
+        # 先在内存里攒好所有行，整个CSV一次写入，避免逐行小写盘
         for row in reader:
-            row["job_category"] = job_name
-            row["job_code"] = job_code
-            combined_file.write(json.dumps(row, ensure_ascii=False) + "\n")
+            lines.append(_dumps_line(dict(zip(keys, (*row, job_name, job_code)))))
             count += 1
+    if lines:
+        combined_file.write("\n".join(lines) + "\n")
     return count
 
 
@@ -367,31 +463,46 @@ async def crawl_jobs(
     append: bool,
 ) -> None:
     mode = "a" if append else "w"
-    with open(combined_path, mode, encoding="utf-8") as combined_file:
-        for job_name in job_names:
-            job_code = job_dict[job_name]
-            print(f"\n=== Crawling {job_name} ({job_code}) ===")
+    # 类目间并发：async Playwright 在同一事件循环里可以安全并发多个页面，
+    # 共享一个浏览器即可，不需要进程池和 user_data_dir 副本。
+    # 并发度压在3，主要受站点限流约束而不是CPU
+    semaphore = asyncio.Semaphore(min(len(job_names), 3) or 1)
+    # 汇总文件是共享句柄，写入需要互斥
+    write_lock = asyncio.Lock()
 
-            url = get_job_url({"job": job_name}, city=city, jobType=job_type)
-            job_output_dir = output_dir / job_code
+    try:
+        with open(combined_path, mode, encoding="utf-8") as combined_file:
 
-            try:
-                csv_path = await get_job_details(
-                    url=url,
-                    max_count=max_count,
-                    min_description_length=min_description_length,
-                    output_dir=str(job_output_dir),
-                )
-            except Exception as exc:
-                print(f"Failed to crawl {job_name}: {exc}")
-                continue
+            async def crawl_one(job_name: str) -> None:
+                job_code = job_dict[job_name]
+                async with semaphore:
+                    print(f"\n=== Crawling {job_name} ({job_code}) ===")
 
-            if not csv_path or not Path(csv_path).exists():
-                print(f"No output generated for {job_name}")
-                continue
+                    url = get_job_url({"job": job_name}, city=city, jobType=job_type)
+                    job_output_dir = output_dir / job_code
 
-            appended = append_csv_to_jsonl(Path(csv_path), combined_file, job_name, job_code)
-            print(f"Added {appended} rows to {combined_path}")
+                    try:
+                        csv_path = await get_job_details(
+                            url=url,
+                            max_count=max_count,
+                            min_description_length=min_description_length,
+                            output_dir=str(job_output_dir),
+                        )
+                    except Exception as exc:
+                        print(f"Failed to crawl {job_name}: {exc}")
+                        return
+
+                    if not csv_path or not Path(csv_path).exists():
+                        print(f"No output generated for {job_name}")
+                        return
+
+                    async with write_lock:
+                        appended = append_csv_to_jsonl(Path(csv_path), combined_file, job_name, job_code)
+                    print(f"Added {appended} rows to {combined_path}")
+
+            await asyncio.gather(*(crawl_one(job_name) for job_name in job_names))
+    finally:
+        await close_browser()
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -416,20 +527,29 @@ def main() -> None:
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # 详细抓取日志落到文件，终端只显示进度条
+    logging.basicConfig(
+        filename=str(output_dir / "crawl.log"),
+        level=logging.INFO,
+        format="%(asctime)s %(name)s %(message)s",
+    )
+
     combined_path = Path(args.combined_path)
     combined_path.parent.mkdir(parents=True, exist_ok=True)
 
     job_names = parse_job_names(args.jobs)
 
-    crawl_jobs(
-        job_names=job_names,
-        output_dir=output_dir,
-        combined_path=combined_path,
-        max_count=args.max_count,
-        min_description_length=args.min_description_length,
-        city=args.city,
-        job_type=args.job_type,
-        append=args.append,
+    asyncio.run(
+        crawl_jobs(
+            job_names=job_names,
+            output_dir=output_dir,
+            combined_path=combined_path,
+            max_count=args.max_count,
+            min_description_length=args.min_description_length,
+            city=args.city,
+            job_type=args.job_type,
+            append=args.append,
+        )
     )
 
 